@@ -2,14 +2,10 @@
 
 from __future__ import annotations
 
-from homeassistant.components.persistent_notification import async_create
 from homeassistant.helpers.translation import async_get_translations
-from importlib.metadata import version as get_version
-from packaging.version import Version
 
 import pymodbus
 import logging
-import asyncio
 
 import voluptuous as vol
 from homeassistant.const import __version__
@@ -18,12 +14,21 @@ from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 
 from .repairs import async_migrate_temperature_typo
 
 from .const import (
     DOMAIN,
+    CONFIG_ENTRY_VERSION,
+    CONF_BAUDRATE,
+    CONF_TRANSPORT,
+    CONF_UNIT_ID,
+    DEFAULT_BAUDRATE,
     DEFAULT_NAME,
+    DEFAULT_PORT,
+    DEFAULT_TRANSPORT,
+    DEFAULT_UNIT_ID,
     DEFAULT_SCAN_INTERVAL,
     # New notification config
     CONF_NOTIFY_ALARMS_MOBILE,
@@ -49,7 +54,8 @@ from .const import (
     DEFAULT_CONNECTION_ERROR_DELAY,
 )
 
-from .hub import AmberModbusHub
+from .connection import unit_unique_id
+from .hub import AmberModbusHub, REGISTER_CACHE_VERSION, register_cache_key
 from .alarm_monitor import AlarmMonitor
 
 _LOGGER = logging.getLogger(__name__)
@@ -70,7 +76,6 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 PLATFORMS = ["sensor", "switch", "number", "select"]
-REQUIRED_VERSION = Version("2025.10.0")
 
 async def async_setup(_hass: HomeAssistant, _config: dict) -> bool:
     """Set up this integration using YAML is not supported."""
@@ -78,35 +83,16 @@ async def async_setup(_hass: HomeAssistant, _config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up an Amber Modbus integration using UI."""
-    # Check minimum version Home Assistant
-    try:
-        ha_version = await hass.async_add_executor_job(lambda: Version(get_version("homeassistant")))
-        if ha_version < REQUIRED_VERSION:
-            raise RuntimeError(
-                f"This integration requires Home Assistant {REQUIRED_VERSION} or higher. Detected version: {ha_version}"
-            )
-
-    except Exception as err:
-        await async_create(
-            hass,
-            title="Itho Amber Integration Error",
-            message=(
-                f"🚫 **Itho Amber integration could not be loaded.**\n\n"
-                f"Required version: `{REQUIRED_VERSION}`\n"
-                f"Detected version: `{ha_version if 'ha_version' in locals() else 'unknown'}`\n\n"
-                f"Error: `{err}`\n\n"
-                "🔧 Please update Home Assistant to activate this integration."
-            ),
-            notification_id="itho_amber_version_blocked"
-        )
-        return False
-
+    # The minimum Home Assistant version is enforced by HACS (hacs.json)
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
 
     name = entry.data.get("name")
     host = entry.data.get("host")
     port = entry.data.get("port")
+    unit_id = entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID)
+    transport = entry.data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+    baudrate = entry.data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)
     scan_interval = entry.data.get("scan_interval")
     
     # Connection error notification settings
@@ -128,40 +114,64 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _LOGGER.info("Setting up %s.%s", DOMAIN, name)
     _LOGGER.debug(f"Used pymodbus version: {pymodbus.__version__}")
-    _LOGGER.debug(f"Required Home Assistant version: {REQUIRED_VERSION}")
-    _LOGGER.debug(f"Detected Home Assistant version: {ha_version}")
+    _LOGGER.debug(f"Detected Home Assistant version: {__version__}")
 
     if name in hass.data[DOMAIN]:
         _LOGGER.warning("Config entry %s is already set up!", name)
         return False
 
-    hub = AmberModbusHub(hass, name, host, port, scan_interval, notify_connection_errors_mobile, notify_connection_errors_persistent, notify_connection_errors_services, connection_error_notification_title, connection_error_delay)
-    await hub.async_config_entry_first_refresh()
+    hub = AmberModbusHub(hass, name, host, port, scan_interval, notify_connection_errors_mobile, notify_connection_errors_persistent, notify_connection_errors_services, connection_error_notification_title, connection_error_delay, config_entry=entry, unit_id=unit_id, transport=transport, baudrate=baudrate)
+    if await hub.async_load_register_cache():
+        # Entities start from the last known registers, the first live poll runs in the background
+        entry.async_create_background_task(hass, hub.async_refresh(), f"{DOMAIN}_{name}_first_refresh")
+    else:
+        await hub.async_config_entry_first_refresh()
 
     # Create alarm monitor
     alarm_monitor = AlarmMonitor(hass, name, notify_alarms_mobile, notify_alarms_persistent, notify_alarms_services, alarm_notification_title, alarm_delay)
 
     hass.data[DOMAIN][name] = {"hub": hub, "alarm_monitor": alarm_monitor}
 
-    for component in PLATFORMS:
-        await hass.config_entries.async_forward_entry_setups(entry, [component])
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Start alarm monitoring after all entities are set up
     alarm_monitor.start_monitoring()
 
-    # Perform migration automatically 
-    try:
-        changed = await async_migrate_temperature_typo(hass)
-        if changed:
-            _LOGGER.info("Automatic entity ID migration completed successfully.")
-    except Exception as err:
-        _LOGGER.error("Automatic entity ID migration failed: %s", err)
-
     _LOGGER.info("Integration setup completed successfully!")
 
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an Amber Modbus entry to the current config entry version."""
+    if entry.version > CONFIG_ENTRY_VERSION:
+        # Downgraded from a newer version of the integration
+        return False
+
+    if entry.version < 2:
+        # Rename entity IDs with the "temperture" typo, this used to run on every start
+        try:
+            changed = await async_migrate_temperature_typo(hass)
+            if changed:
+                _LOGGER.info("Automatic entity ID migration completed successfully.")
+        except Exception as err:
+            _LOGGER.error("Automatic entity ID migration failed: %s", err)
+        hass.config_entries.async_update_entry(entry, version=2)
+
+    if entry.version < 3:
+        # Entries used to be unique per host, now per unit behind a gateway
+        port = entry.data.get(CONF_PORT, DEFAULT_PORT)
+        unit_id = entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID)
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_UNIT_ID: unit_id},
+            unique_id=unit_unique_id(entry.data[CONF_HOST], port, unit_id),
+            version=3,
+        )
+
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Amber Modbus entry."""
     name = entry.data.get(CONF_NAME)
@@ -172,17 +182,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if alarm_monitor:
             alarm_monitor.stop_monitoring()
     
-    unload_ok = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(entry, component)
-                for component in PLATFORMS
-            ]
-        )
-    )
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
         if name in hass.data[DOMAIN]:
-            hass.data[DOMAIN].pop(name)
+            hub = hass.data[DOMAIN].pop(name)["hub"]
+            # Cancel in-flight Modbus requests and pending writes
+            await hub.async_shutdown()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the register cache of a deleted Amber Modbus entry."""
+    await Store(hass, REGISTER_CACHE_VERSION, register_cache_key(entry.entry_id)).async_remove()
@@ -16,9 +16,20 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector
 
+from .connection import unit_unique_id
 from .const import (
+    BAUDRATES,
+    CONFIG_ENTRY_VERSION,
+    CONF_BAUDRATE,
+    CONF_TRANSPORT,
+    CONF_UNIT_ID,
+    DEFAULT_BAUDRATE,
     DEFAULT_NAME,
     DEFAULT_PORT,
+    DEFAULT_TRANSPORT,
+    DEFAULT_UNIT_ID,
+    TRANSPORT_SERIAL,
+    TRANSPORTS,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     # New notification config
@@ -79,6 +90,18 @@ def _split_services(value) -> list[str]:
     return [s.strip() for s in str(value).split(",") if s.strip()]
 
 
+# Modbus unit (slave) IDs a gateway can address
+UNIT_ID_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=247))
+TRANSPORT_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=list(TRANSPORTS),
+        translation_key=CONF_TRANSPORT,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+BAUDRATE_VALIDATOR = vol.All(vol.Coerce(int), vol.In(BAUDRATES))
+
+
 def _build_data_schema(hass: HomeAssistant) -> vol.Schema:
     options = _get_notify_service_options(hass, mobile_only=True)
     service_selector = selector.SelectSelector(
@@ -92,8 +115,11 @@ def _build_data_schema(hass: HomeAssistant) -> vol.Schema:
     return vol.Schema(
         {
             vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
+            vol.Required(CONF_TRANSPORT, default=DEFAULT_TRANSPORT): TRANSPORT_SELECTOR,
             vol.Required(CONF_HOST): str,
             vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
+            vol.Required(CONF_UNIT_ID, default=DEFAULT_UNIT_ID): UNIT_ID_VALIDATOR,
+            vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): BAUDRATE_VALIDATOR,
             vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
 
             # === ALARM NOTIFICATIONS (P/F/E/S) ===
@@ -136,19 +162,38 @@ def host_valid(host):
         return all(x and not disallowed.search(x) for x in host.split("."))
 
 
+def connection_valid(transport, host):
+    """Return True if host is a valid host for the transport, a device path for serial."""
+    if transport == TRANSPORT_SERIAL:
+        return bool(host) and not any(c.isspace() for c in host)
+    return host_valid(host)
+
+
 @callback
-def amber_modbus_entries(hass: HomeAssistant):
-    """Return the hosts already configured."""
+def amber_modbus_entries(hass: HomeAssistant, exclude_entry_id: str | None = None):
+    """Return the unique IDs of the units already configured, except the excluded entry."""
     return {
-        entry.data[CONF_HOST]
+        unit_unique_id(
+            entry.data[CONF_HOST],
+            entry.data.get(CONF_PORT, DEFAULT_PORT),
+            entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID),
+            entry.data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT),
+        )
         for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != exclude_entry_id
     }
 
 
+@callback
+def amber_modbus_names(hass: HomeAssistant):
+    """Return the names already in use, hubs and entities are keyed by name."""
+    return {entry.data.get(CONF_NAME) for entry in hass.config_entries.async_entries(DOMAIN)}
+
+
 class AmberModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the initial setup flow."""
 
-    VERSION = 1
+    VERSION = CONFIG_ENTRY_VERSION
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
     @staticmethod
@@ -157,28 +202,38 @@ class AmberModbusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return AmberOptionsFlowHandler()
 
-    def _host_in_configuration_exists(self, host) -> bool:
-        return host in amber_modbus_entries(self.hass)
+    def _unit_in_configuration_exists(self, unique_id) -> bool:
+        return unique_id in amber_modbus_entries(self.hass)
 
     async def async_step_user(self, user_input=None):
         errors = {}
 
         if user_input is not None:
             host = user_input[CONF_HOST]
-
-            if self._host_in_configuration_exists(host):
-                errors[CONF_HOST] = "already_configured"
-            elif not host_valid(host):
+            port = user_input.get(CONF_PORT, DEFAULT_PORT)
+            unit_id = user_input.get(CONF_UNIT_ID, DEFAULT_UNIT_ID)
+            transport = user_input.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+            unique_id = unit_unique_id(host, port, unit_id, transport)
+
+            if self._unit_in_configuration_exists(unique_id):
+                errors[CONF_UNIT_ID] = "already_configured"
+            elif user_input.get(CONF_NAME, DEFAULT_NAME) in amber_modbus_names(self.hass):
+                errors[CONF_NAME] = "name_exists"
+            elif not connection_valid(transport, host):
                 errors[CONF_HOST] = "invalid_host"
             else:
-                await self.async_set_unique_id(host)
+                # Several units can share one gateway, each has its own entry
+                await self.async_set_unique_id(unique_id)
                 self._abort_if_unique_id_configured()
                 
                 # Process all the data including new notification settings
                 data = {
                     CONF_NAME: user_input.get(CONF_NAME, DEFAULT_NAME),
                     CONF_HOST: host,
-                    CONF_PORT: user_input.get(CONF_PORT, DEFAULT_PORT),
+                    CONF_PORT: port,
+                    CONF_UNIT_ID: unit_id,
+                    CONF_TRANSPORT: transport,
+                    CONF_BAUDRATE: user_input.get(CONF_BAUDRATE, DEFAULT_BAUDRATE),
                     CONF_SCAN_INTERVAL: user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
                     # Alarm notifications
                     CONF_NOTIFY_ALARMS_MOBILE: user_input.get(CONF_NOTIFY_ALARMS_MOBILE, DEFAULT_NOTIFY_ALARMS_MOBILE),
@@ -215,12 +270,25 @@ class AmberOptionsFlowHandler(config_entries.OptionsFlow):
             _LOGGER.debug(f"Received user_input: {user_input}")
             # Validate the host
             host = user_input.get(CONF_HOST)
-            if host and not host_valid(host):
+            transport = user_input.get(CONF_TRANSPORT, self.config_entry.data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT))
+            if host and not connection_valid(transport, host):
                 return self.async_show_form(
                     step_id="init",
                     data_schema=self._get_options_schema(),
                     errors={CONF_HOST: "invalid_host"},
                 )
+
+            host = user_input.get(CONF_HOST, self.config_entry.data.get(CONF_HOST))
+            port = user_input.get(CONF_PORT, self.config_entry.data.get(CONF_PORT, DEFAULT_PORT))
+            unit_id = user_input.get(CONF_UNIT_ID, self.config_entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID))
+            unique_id = unit_unique_id(host, port, unit_id, transport)
+            # Another entry may already poll this unit on this gateway
+            if unique_id in amber_modbus_entries(self.hass, self.config_entry.entry_id):
+                return self.async_show_form(
+                    step_id="init",
+                    data_schema=self._get_options_schema(),
+                    errors={CONF_UNIT_ID: "already_configured"},
+                )
             
             # Validate alarm notify services if alarms mobile is enabled
             notify_alarms_services = _normalize_services(user_input.get(CONF_NOTIFY_ALARMS_SERVICES, ""))
@@ -261,15 +329,20 @@ class AmberOptionsFlowHandler(config_entries.OptionsFlow):
             # Ensure delays are integers
             alarm_delay = int(user_input.get(CONF_ALARM_DELAY, DEFAULT_ALARM_DELAY))
             connection_error_delay = int(user_input.get(CONF_CONNECTION_ERROR_DELAY, DEFAULT_CONNECTION_ERROR_DELAY))
-            
+
+
             # Update the config entry with new data
             # Note: NAME is only editable during initial setup, not in options
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
+                unique_id=unique_id,
                 data={
                     CONF_NAME: self.config_entry.data.get(CONF_NAME, DEFAULT_NAME),
-                    CONF_HOST: user_input.get(CONF_HOST, self.config_entry.data.get(CONF_HOST)),
-                    CONF_PORT: user_input.get(CONF_PORT, self.config_entry.data.get(CONF_PORT, DEFAULT_PORT)),
+                    CONF_HOST: host,
+                    CONF_PORT: port,
+                    CONF_UNIT_ID: unit_id,
+                    CONF_TRANSPORT: transport,
+                    CONF_BAUDRATE: user_input.get(CONF_BAUDRATE, self.config_entry.data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)),
                     CONF_SCAN_INTERVAL: user_input.get(CONF_SCAN_INTERVAL, self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
                     # Alarm notifications
                     CONF_NOTIFY_ALARMS_MOBILE: user_input.get(CONF_NOTIFY_ALARMS_MOBILE, DEFAULT_NOTIFY_ALARMS_MOBILE),
@@ -300,6 +373,10 @@ class AmberOptionsFlowHandler(config_entries.OptionsFlow):
         return vol.Schema(
             {
                 # Connection settings
+                vol.Required(
+                    CONF_TRANSPORT,
+                    default=self.config_entry.data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+                ): TRANSPORT_SELECTOR,
                 vol.Required(
                     CONF_HOST,
                     default=self.config_entry.data.get(CONF_HOST)
@@ -308,6 +385,14 @@ class AmberOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_PORT,
                     default=self.config_entry.data.get(CONF_PORT, DEFAULT_PORT)
                 ): int,
+                vol.Required(
+                    CONF_UNIT_ID,
+                    default=self.config_entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID)
+                ): UNIT_ID_VALIDATOR,
+                vol.Optional(
+                    CONF_BAUDRATE,
+                    default=self.config_entry.data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)
+                ): BAUDRATE_VALIDATOR,
                 vol.Optional(
                     CONF_SCAN_INTERVAL,
                     default=self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
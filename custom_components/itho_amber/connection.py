@@ -0,0 +1,234 @@
+"""Shared Modbus connections of the Itho Amber integration.
+
+Many RS485-to-TCP gateways accept a single TCP client, and a serial port
+can only be opened once. Every hub talking to the same gateway or serial
+device therefore shares one ModbusConnection, which owns the socket and
+hands out turns to its owners round-robin, so a hub polling a large read
+plan cannot starve the others.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import asynccontextmanager
+
+from pymodbus.client import ModbusBaseClient
+from pymodbus.exceptions import ConnectionException
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DEFAULT_BAUDRATE, DEFAULT_TRANSPORT, DOMAIN, TRANSPORT_SERIAL
+from .transport import create_client, inter_frame_delay
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a connect or a single request may take
+REQUEST_TIMEOUT = 10
+# Seconds without a good response after which the socket is reopened
+RECONNECT_AFTER_SILENCE = 300
+
+DATA_CONNECTIONS = f"{DOMAIN}_connections"
+
+
+def connection_key(host: str, port: int, transport: str = DEFAULT_TRANSPORT) -> str:
+    """Return the key of the shared connection to a gateway or serial device."""
+    if transport == TRANSPORT_SERIAL:
+        return host
+    return f"{host}:{port}"
+
+
+def unit_unique_id(host: str, port: int, unit_id: int, transport: str = DEFAULT_TRANSPORT) -> str:
+    """Return the config entry unique ID of a unit behind a gateway or serial device."""
+    return f"{connection_key(host, port, transport)}:{unit_id}"
+
+
+class ModbusConnection:
+    """One Modbus socket shared by the hubs of a gateway.
+
+    Owners queue for a turn; when the socket is busy, turns are granted to
+    the owners with waiting requests in round-robin order and to the
+    requests of one owner in FIFO order. The socket is opened on demand and
+    closed when every owner has disconnected. RTU transports keep the bus
+    silent for the inter-frame delay between a response and the next request.
+    """
+
+    def __init__(self, host: str, port: int, transport: str = DEFAULT_TRANSPORT, baudrate: int = DEFAULT_BAUDRATE) -> None:
+        """Initialize a connection that is not connected yet."""
+        self.host = host
+        self.port = port
+        self.transport = transport
+        self.baudrate = baudrate
+        self.key = connection_key(host, port, transport)
+        self.owners: set[Hashable] = set()
+        self._client: ModbusBaseClient | None = None
+        self._frame_gap = inter_frame_delay(transport, baudrate)
+        self._quiet_until = 0.0
+        self._active: set[Hashable] = set()
+        self._busy = False
+        self._waiters: dict[Hashable, deque[asyncio.Future]] = {}
+        self._ready: deque[Hashable] = deque()
+        self._last_response = 0.0
+
+    @property
+    def shared(self) -> bool:
+        """Return True if more than one hub uses this connection."""
+        return len(self.owners) > 1
+
+    @asynccontextmanager
+    async def _turn(self, owner: Hashable):
+        """Hold the socket for one request of owner."""
+        if self._busy or self._ready:
+            waiter = asyncio.get_running_loop().create_future()
+            queue = self._waiters.setdefault(owner, deque())
+            if not queue:
+                self._ready.append(owner)
+            queue.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Granted just before the cancellation, pass the turn on
+                    self._release()
+                else:
+                    self._forget(owner, waiter)
+                raise
+        else:
+            self._busy = True
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _forget(self, owner: Hashable, waiter: asyncio.Future) -> None:
+        """Drop a cancelled waiter from the queue of its owner."""
+        queue = self._waiters.get(owner)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        if not queue:
+            del self._waiters[owner]
+            self._ready.remove(owner)
+
+    def _release(self) -> None:
+        """Grant the socket to the next owner in turn, or mark it idle."""
+        while self._ready:
+            owner = self._ready.popleft()
+            queue = self._waiters[owner]
+            waiter = queue.popleft()
+            if queue:
+                # Back of the line, other owners go first
+                self._ready.append(owner)
+            else:
+                del self._waiters[owner]
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._busy = False
+
+    async def _async_ensure_connected(self, timeout: float) -> bool:
+        """Make sure the socket is open, reopening it when it went silent."""
+        if self._client is not None and self._client.connected:
+            if time.monotonic() - self._last_response <= RECONNECT_AFTER_SILENCE:
+                return True
+            _LOGGER.warning(
+                f"No good Modbus response from {self.key} for {RECONNECT_AFTER_SILENCE}s, reconnecting"
+            )
+
+        self.reset()
+        try:
+            self._client = create_client(self.transport, self.host, self.port, self.baudrate, REQUEST_TIMEOUT)
+            async with asyncio.timeout(timeout):
+                connected = await self._client.connect()
+        except TimeoutError:
+            connected = False
+        except (OSError, RuntimeError) as e:
+            # RuntimeError: pyserial is not installed
+            _LOGGER.error(f"Cannot open Modbus connection {self.key}: {e}")
+            connected = False
+
+        if connected:
+            # A fresh socket gets the full silence period
+            self._last_response = time.monotonic()
+        return connected
+
+    async def async_execute(
+        self, owner: Hashable, request: Callable[[ModbusBaseClient], Awaitable], timeout: float = REQUEST_TIMEOUT
+    ):
+        """Run request(client) in the next turn of owner and return its response.
+
+        timeout bounds the connect and the request each, the time waiting for
+        a turn is not counted. Raises ConnectionException when the socket
+        cannot be opened and TimeoutError when the request times out.
+        """
+        async with self._turn(owner):
+            self._active.add(owner)
+            if not await self._async_ensure_connected(timeout):
+                raise ConnectionException(f"Could not connect to {self.key}")
+            if self._frame_gap:
+                delay = self._quiet_until - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            try:
+                async with asyncio.timeout(timeout):
+                    response = await request(self._client)
+            finally:
+                self._quiet_until = time.monotonic() + self._frame_gap
+            if response is not None and not response.isError():
+                self._last_response = time.monotonic()
+            return response
+
+    def reset(self) -> None:
+        """Close the socket, the next request opens a new one."""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception:
+                pass
+            self._client = None
+
+    def disconnect(self, owner: Hashable) -> None:
+        """Mark owner idle and close the socket when no owner uses it anymore."""
+        self._active.discard(owner)
+        if not self._active:
+            self.reset()
+
+
+@callback
+def async_acquire_connection(
+    hass: HomeAssistant,
+    host: str,
+    port: int,
+    owner: Hashable,
+    transport: str = DEFAULT_TRANSPORT,
+    baudrate: int = DEFAULT_BAUDRATE,
+) -> ModbusConnection:
+    """Return the shared connection to a gateway or serial device, registering owner as a user."""
+    connections = hass.data.setdefault(DATA_CONNECTIONS, {})
+    key = connection_key(host, port, transport)
+    connection = connections.get(key)
+    if connection is None:
+        connection = connections[key] = ModbusConnection(host, port, transport, baudrate)
+    elif (connection.transport, connection.baudrate) != (transport, baudrate):
+        _LOGGER.warning(
+            f"Modbus connection {key} is already open as {connection.transport} at {connection.baudrate} baud, "
+            f"ignoring {transport} at {baudrate} baud"
+        )
+    elif not connection.shared:
+        _LOGGER.debug(f"Sharing the Modbus connection to {key}")
+    connection.owners.add(owner)
+    return connection
+
+
+@callback
+def async_release_connection(hass: HomeAssistant, connection: ModbusConnection, owner: Hashable) -> None:
+    """Unregister owner, closing and forgetting the connection after its last user."""
+    connection.owners.discard(owner)
+    connection.disconnect(owner)
+    if not connection.owners:
+        connection.reset()
+        connections = hass.data.get(DATA_CONNECTIONS, {})
+        if connections.get(connection.key) is connection:
+            del connections[connection.key]
@@ -0,0 +1,155 @@
+"""Compiled register decode plan for the Itho Amber integration."""
+
+from collections.abc import Iterable, Mapping
+
+from .const import (
+    CODEC_BIT,
+    CODEC_DELTA,
+    CODEC_ENUM,
+    CODEC_INT16,
+    CODEC_SCALED,
+    CODEC_STATUS,
+    CODEC_STATUS_WORD,
+    CODEC_VERSION,
+    REGISTER_CODECS,
+)
+from .register_image import RegisterImage
+
+
+def highest_bit_message(register_value: int, bit_messages: dict) -> str:
+    """Return the message of the highest set bit, or an empty string."""
+    highest_bit = max((bit for bit in bit_messages if register_value & (1 << bit)), default=None)
+    return bit_messages[highest_bit] if highest_bit is not None else ""
+
+
+class DecodePlan:
+    """Flat per-codec arrays of decode steps, compiled once per hub.
+
+    Every array holds plain tuples so decoding a register image is a handful
+    of tight loops without dictionary building or table lookups by name.
+    """
+
+    __slots__ = (
+        "raw", "scaled", "enum", "status", "bits", "status_words", "versions", "deltas", "_keys_by_register", "_encoders"
+    )
+
+    def __init__(self, keys: Iterable[str], codecs: Mapping[str, tuple] = REGISTER_CODECS) -> None:
+        """Compile the decode steps for the given data keys."""
+        self.raw: list[tuple[str, int]] = []
+        self.scaled: list[tuple[str, int, float]] = []
+        self.enum: list[tuple[str, int, dict]] = []
+        self.status: list[tuple[str, int, dict]] = []
+        self.bits: list[tuple[str, int, int, dict]] = []
+        self.status_words: list[tuple[str, int, dict]] = []
+        self.versions: list[tuple[str, int, int | None, float]] = []
+        self.deltas: list[tuple[str, int, int, float]] = []
+        self._keys_by_register: dict[int, list[str]] = {}
+        # Key -> (codec, register, scale, table) of the keys that can be written
+        self._encoders: dict[str, tuple[str, int, float | None, dict | None]] = {}
+
+        for key in dict.fromkeys(keys):
+            if key in codecs:
+                codec, register, aux, scale, table, bit = codecs[key]
+            elif key.isdigit():
+                codec, register, aux, scale, table, bit = CODEC_INT16, int(key), None, None, None, None
+            else:
+                # Not backed by a register, e.g. connection_status
+                continue
+
+            for dependency in (register, aux):
+                if dependency is not None:
+                    self._keys_by_register.setdefault(dependency, []).append(key)
+
+            if codec in (CODEC_INT16, CODEC_SCALED, CODEC_ENUM, CODEC_STATUS):
+                self._encoders[key] = (codec, register, scale, table)
+
+            if codec == CODEC_INT16:
+                self.raw.append((key, register))
+            elif codec == CODEC_SCALED:
+                self.scaled.append((key, register, scale))
+            elif codec == CODEC_ENUM:
+                self.enum.append((key, register, table))
+            elif codec == CODEC_STATUS:
+                self.status.append((key, register, table))
+            elif codec == CODEC_BIT:
+                self.bits.append((key, register, bit, table))
+            elif codec == CODEC_STATUS_WORD:
+                self.status_words.append((key, register, table))
+            elif codec == CODEC_VERSION:
+                self.versions.append((key, register, aux, scale))
+            elif codec == CODEC_DELTA:
+                self.deltas.append((key, register, aux, scale))
+            else:
+                raise ValueError(f"Unknown codec {codec} for key {key}")
+
+    def keys_for_registers(self, registers: Iterable[int]) -> set[str]:
+        """Return the keys decoded from any of the given registers."""
+        by_register = self._keys_by_register
+        return {key for register in registers for key in by_register.get(register, ())}
+
+    def encode(self, key: str, value) -> tuple[int, list[int]]:
+        """Return the register and register words that write value to key.
+
+        Lookup table keys accept a label or a raw value, scaled keys take the
+        value in their unit. Raises ValueError for keys that cannot be written
+        or values that do not fit a register.
+        """
+        if key not in self._encoders:
+            raise ValueError(f"Key {key} cannot be written")
+        codec, register, scale, table = self._encoders[key]
+
+        if codec in (CODEC_ENUM, CODEC_STATUS) and value in table.values():
+            raw = next(raw for raw, label in table.items() if label == value)
+        elif codec == CODEC_SCALED:
+            raw = round(float(value) / scale)
+        else:
+            raw = int(value)
+
+        if not -0x8000 <= raw <= 0x7FFF:
+            raise ValueError(f"Value {value} for key {key} does not fit an INT16 register")
+        return register, [raw & 0xFFFF]
+
+    def decode(self, image: RegisterImage) -> dict:
+        """Decode all keys whose registers are present in the register image."""
+        data = {}
+        values = image.values
+        valid = image.valid
+
+        for key, register in self.raw:
+            if valid[register]:
+                data[key] = values[register]
+
+        for key, register, scale in self.scaled:
+            if valid[register]:
+                data[key] = round(values[register] * scale, 2)
+
+        for key, register, table in self.enum:
+            if valid[register]:
+                val = values[register]
+                data[key] = table.get(val, val)
+
+        for key, register, table in self.status:
+            if valid[register] and values[register] in table:
+                data[key] = table[values[register]]
+
+        for key, register, bit, table in self.bits:
+            if valid[register]:
+                data[key] = table[(values[register] >> bit) & 1]
+
+        for key, register, table in self.status_words:
+            if valid[register]:
+                data[key] = highest_bit_message(values[register], table)
+
+        for key, register, aux, scale in self.versions:
+            if not valid[register]:
+                continue
+            if aux is None:
+                data[key] = f"V{round(values[register] * scale, 2)}"
+            elif valid[aux]:
+                data[key] = f"V{round(values[register] * scale, 2)}-T{values[aux] >> 5}"
+
+        for key, register, aux, scale in self.deltas:
+            if valid[register] and valid[aux]:
+                data[key] = round(abs(values[register] - values[aux]) * scale, 2)
+
+        return data
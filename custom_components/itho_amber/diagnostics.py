@@ -0,0 +1,45 @@
+"""Diagnostics support for the Itho Amber integration."""
+
+from __future__ import annotations
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ATTR_SW_VERSION,
+    CONF_NOTIFY_ALARMS_SERVICES,
+    CONF_NOTIFY_CONNECTION_ERRORS_SERVICES,
+    CONF_NOTIFY_SERVICES,
+    DOMAIN,
+)
+
+# The gateway address and the notify services name devices in the home
+TO_REDACT = {
+    CONF_HOST,
+    CONF_NOTIFY_SERVICES,
+    CONF_NOTIFY_ALARMS_SERVICES,
+    CONF_NOTIFY_CONNECTION_ERRORS_SERVICES,
+}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for a config entry.
+
+    Everything comes from the memory of the hub: the register image, the
+    rolling timing windows and the write log. No Modbus request is made.
+    """
+    diagnostics = {
+        "version": ATTR_SW_VERSION,
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+    }
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.data.get(CONF_NAME))
+    if entry_data is None:
+        diagnostics["hub"] = None
+    else:
+        diagnostics["hub"] = entry_data["hub"].diagnostics()
+    return diagnostics
@@ -2,44 +2,114 @@
 
 import time
 import logging
-import threading
 import asyncio
-import traceback
 from datetime import timedelta, datetime
 
-from pymodbus.client import ModbusTcpClient
 from pymodbus.exceptions import ConnectionException, ModbusIOException
 from homeassistant.components.persistent_notification import async_create as create_persistent_notification
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.core import CALLBACK_TYPE, callback, HomeAssistant
+from homeassistant.util import dt as dt_util
+from homeassistant.core import CALLBACK_TYPE, Event, callback, HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 
+from .connection import REQUEST_TIMEOUT, async_acquire_connection, async_release_connection
 from .const import (
-    DOMAIN, LOGIN_STATUS, ON_OFF_STATUS, PUMP_TYPE, CURRENT_OPERATION_MODE,
-    EXTERNAL_CONTROL, HWTBH_PRIORITY_MODE, MODE_SIGNAL_TYPE, MODE_SIGNAL_OUTPUT,
-    DISPLAY_TIME, FAILURE_STATUS, ACTIVE_STATUS)
+    DOMAIN, DEFAULT_BAUDRATE, DEFAULT_TRANSPORT, DEFAULT_UNIT_ID, DIAGNOSTIC_KEYS, REGISTER_CODECS, FIRST_REALTIME_REGISTER, FAST_TIER_REGISTERS,
+    DEFAULT_FAST_SCAN_INTERVAL, DEFAULT_SETTINGS_SCAN_INTERVAL, TIER_FAST,
+    TIER_NORMAL, TIER_SLOW, POLL_TIERS)
+from .decoder import DecodePlan
+from .poll_stats import PollStats, block_name, milliseconds, percentile
+from .register_image import RegisterImage
+from .range_health import RangeHealth
+from .retry import CIRCUIT_HALF_OPEN, CIRCUIT_OPEN, RetryPolicy
+from .read_plan import build_read_plan, entity_keys, entity_registers
 
 _LOGGER = logging.getLogger(__name__)
 
-MAX_READ_RETRIES = 3
+STALE_AFTER_INTERVALS = 3  # Tier intervals without a successful read before a value is dropped
+STALE_REGISTER_AGE = 300  # Minimum age in seconds before a value is dropped
+REGISTER_CACHE_VERSION = 1
+REGISTER_CACHE_SAVE_DELAY = 600  # Seconds between saves of the register cache while polling
+PROBE_REGISTER = FIRST_REALTIME_REGISTER  # Single cheap register to probe an unresponsive gateway
+# Modbus exception codes that reject the registers of a request: illegal function,
+# illegal data address, illegal data value, device failure. Busy and gateway
+# exceptions say nothing about the registers.
+REGISTER_EXCEPTION_CODES = (1, 2, 3, 4)
+WRITE_DEBOUNCE = 0.7  # Seconds without new writes before the write queue is flushed
+WRITE_VERIFY_INITIAL_DELAY = 0.1  # Seconds before the first read-back of written registers
+WRITE_VERIFY_MAX_DELAY = 1.0  # Backoff cap between read-back attempts
+WRITE_VERIFY_TIMEOUT = 5  # Seconds to wait for written registers to read back the written values
+WRITE_VERIFY_READ_TIMEOUT = 2  # Seconds a single read-back may take, a lost reply leaves time for another
+MAX_REGISTERS_PER_WRITE = 123  # Maximum number of registers in a write multiple registers (FC16) request
+
+
+def register_cache_key(entry_id: str) -> str:
+    """Return the storage key of the register cache of a config entry."""
+    return f"{DOMAIN}.{entry_id}.registers"
+
+
+class AmberWriteError(HomeAssistantError):
+    """Raised when a register write is rejected or not confirmed by the device."""
+
+
+def contiguous_runs(writes: dict[int, int], max_count: int = MAX_REGISTERS_PER_WRITE) -> list[tuple[int, list[int]]]:
+    """Group address -> value writes into (start, values) runs of contiguous registers."""
+    runs = []
+    for address in sorted(writes):
+        if runs:
+            start, values = runs[-1]
+            if address == start + len(values) and len(values) < max_count:
+                values.append(writes[address])
+                continue
+        runs.append((address, [writes[address]]))
+    return runs
+
 
 class AmberModbusHub(DataUpdateCoordinator[dict]):
-    """Thread safe wrapper class for pymodbus."""
+    """Asyncio wrapper class for pymodbus."""
 
-    def __init__(self, hass: HomeAssistant, name: str, host: str, port: int | float, scan_interval: int | float, notify_connection_errors_mobile: bool = False, notify_connection_errors_persistent: bool = False, notify_services: str = "", notification_title: str = "Warmtepomp verbindingsfout!", connection_error_delay: int = 60):
+    def __init__(self, hass: HomeAssistant, name: str, host: str, port: int | float, scan_interval: int | float, notify_connection_errors_mobile: bool = False, notify_connection_errors_persistent: bool = False, notify_services: str = "", notification_title: str = "Warmtepomp verbindingsfout!", connection_error_delay: int = 60, config_entry: ConfigEntry | None = None, unit_id: int = DEFAULT_UNIT_ID, transport: str = DEFAULT_TRANSPORT, baudrate: int = DEFAULT_BAUDRATE):
         """Initialize the Itho Daalderop Amber 65/95/120 Modbus hub."""
-        super().__init__(hass, _LOGGER, name=name, update_interval=timedelta(seconds=scan_interval))
+        # Every tier has its own cadence, the coordinator ticks at the fastest one
+        self._tier_intervals = {
+            TIER_FAST: min(scan_interval, DEFAULT_FAST_SCAN_INTERVAL),
+            TIER_NORMAL: scan_interval,
+            TIER_SLOW: max(scan_interval, DEFAULT_SETTINGS_SCAN_INTERVAL),
+        }
+        self._tier_next_poll = {tier: 0.0 for tier in POLL_TIERS}
+        super().__init__(hass, _LOGGER, name=name, config_entry=config_entry, update_interval=timedelta(seconds=self._tier_intervals[TIER_FAST]))
 
         self._flush_running = False
-        self._flush_pending = False
         self._ha_started = False
-        self._write_queue = []
-        self._write_timer = None
-        self._modbus_lock = threading.Lock()
-        self._lock = threading.Lock()
-        self._client = None
+        self._write_queue = []  # (address, values, future) per queued write
+        self._write_event = asyncio.Event()
+        self._write_task = None
+        self._retry_policy = RetryPolicy()
+        self._stats = PollStats()  # Rolling timing windows shown by the diagnostic sensors
+        self._closing = False
+        self._changed_keys = None  # Keys changed by the last update, None means all
+        self._last_notified_success = True
         self._host = host
         self._port = int(port)
+        self._unit = int(unit_id)
+        # Socket to the gateway or serial device, shared with the hubs of other units behind it
+        self._connection = async_acquire_connection(hass, host, self._port, self, transport, int(baudrate))
+
+        # Derive the read blocks from the registers the enabled entities use
+        # and rebuild them whenever an entity is enabled or disabled
+        self._tier_registers = {tier: set() for tier in POLL_TIERS}
+        self._tier_plans = {}
+        self._range_health = RangeHealth()
+        self._async_rebuild_read_plan()
+        self._unsub_entity_registry = hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_entity_registry_updated,
+            event_filter=self._entity_registry_event_filter,
+        )
         self._consecutive_failures = 0  # Track consecutive connection failures
         self._last_successful_read = None  # Track last time we got valid data
         self._notify_connection_errors_mobile = notify_connection_errors_mobile
@@ -50,28 +120,92 @@ class AmberModbusHub(DataUpdateCoordinator[dict]):
         self._connection_error_notified = False
         self._connection_lost_time = None  # Track when connection was first lost
         self._last_partial_failure_details = ""
-        # Calculate how many failures based on configured delay and scan_interval
-        self._failures_for_delay = max(1, int(connection_error_delay / scan_interval))
-        _LOGGER.debug(f"Connection error notification will be sent after {self._failures_for_delay} failures ({connection_error_delay}s / {scan_interval}s)")
+        # Calculate how many failures based on configured delay and poll cycle
+        cycle_interval = self._tier_intervals[TIER_FAST]
+        self._failures_for_delay = max(1, int(connection_error_delay / cycle_interval))
+        _LOGGER.debug(f"Connection error notification will be sent after {self._failures_for_delay} failures ({connection_error_delay}s / {cycle_interval}s)")
         
         # Use persistent storage in hass.data - survives reloads
         storage_key = f"{name}_data_store"
         if storage_key not in hass.data:
             hass.data[storage_key] = {
-                "setting_data": {},
-                "realtime_data": {},
+                "registers": RegisterImage(),
             }
         self.data_store = hass.data[storage_key]
+        # Register image: last value read (INT16) per address, updated in place by every tier
+        self._registers = self.data_store["registers"]
+        # Last register image on disk, so a restart can start from it
+        self._register_cache = Store(
+            hass, REGISTER_CACHE_VERSION, register_cache_key(config_entry.entry_id if config_entry else name)
+        )
+        self._register_cache_pending = False
+        # Decode steps for every entity key, compiled once
+        self._decode_plan = DecodePlan([*entity_keys(), *REGISTER_CODECS])
 
         # Mark HA as not fully started yet
         self._ha_started = False
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, self._on_ha_started)
 
-        try:
-            self._client = ModbusTcpClient(host=host, port=port, timeout=60)
-            _LOGGER.debug(f"Modbus client initialized for {host}:{port}")
-        except Exception as e:
-            _LOGGER.exception(f"Failed to initialize Modbus client: {e}")
+    def _enabled_keys(self) -> list[str]:
+        """Return the entity keys that are not disabled in the entity registry."""
+        keys = entity_keys()
+        if self.config_entry is None:
+            return keys
+
+        prefix = f"{self.name}_"
+        registry = er.async_get(self.hass)
+        disabled = {
+            entry.unique_id[len(prefix):]
+            for entry in er.async_entries_for_config_entry(registry, self.config_entry.entry_id)
+            if entry.disabled_by is not None and entry.unique_id.startswith(prefix)
+        }
+        # Entities that are not registered yet will be created enabled
+        return [key for key in keys if key not in disabled]
+
+    @callback
+    def _async_rebuild_read_plan(self) -> None:
+        """Split the registers of the enabled entities over the polling tiers."""
+        registers = entity_registers(self._enabled_keys())
+        tier_registers = {
+            TIER_FAST: {r for r in registers if r in FAST_TIER_REGISTERS},
+            TIER_NORMAL: {
+                r for r in registers
+                if r >= FIRST_REALTIME_REGISTER and r not in FAST_TIER_REGISTERS
+            },
+            TIER_SLOW: {r for r in registers if r < FIRST_REALTIME_REGISTER},
+        }
+        if tier_registers == self._tier_registers:
+            return
+
+        self._tier_registers = tier_registers
+        self._tier_plans = {}
+        for tier in POLL_TIERS:
+            _LOGGER.debug(f"Read plan {tier} tier: {self._tier_read_plan((tier,))}")
+
+    def _tier_read_plan(self, tiers) -> list[tuple[int, int]]:
+        """Return the read blocks for a combination of tiers that are due together."""
+        key = frozenset(tiers)
+        plan = self._tier_plans.get(key)
+        if plan is None:
+            registers = set()
+            for tier in key:
+                registers |= self._tier_registers[tier]
+            # Quarantined registers are neither read nor bridged by a block
+            registers -= self._range_health.quarantined.keys()
+            plan = self._tier_plans[key] = build_read_plan(registers, windows=self._range_health.windows())
+        return plan
+
+    @callback
+    def _entity_registry_event_filter(self, event_data) -> bool:
+        """Only rebuild the read plan when entities are added, removed, enabled or disabled."""
+        if event_data["action"] in ("create", "remove"):
+            return True
+        return event_data["action"] == "update" and "disabled_by" in event_data.get("changes", {})
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Rebuild the read plan after an entity registry change."""
+        self._async_rebuild_read_plan()
 
     def _on_ha_started(self, event):
         """Callback fired when Home Assistant has fully started."""
@@ -93,56 +227,66 @@ class AmberModbusHub(DataUpdateCoordinator[dict]):
                 _LOGGER.exception(f"Error while closing the connection: {e}")
 
     def close(self) -> None:
-        """Disconnect client."""
+        """Disconnect client, the socket stays open while other units use it."""
         try:
-            with self._lock:
-                if self._client is not None:
-                    self._client.close()
-                    self._client = None
+            self._connection.disconnect(self)
             _LOGGER.debug("Modbus client connection closed")
         except Exception as e:
             _LOGGER.exception(f"Error closing Modbus connection: {e}")
 
-    def _read_holding_registers(self, unit, address, count):
-        """Safely read holding registers with reconnection logic."""
-        # Block ALL reads during write flush
-        if self._flush_running:
-            _LOGGER.debug("Read skipped because write flush is running")
-            return None
-        
-        try:
-            # Ensure connection is alive
-            if self._client is None or not self._client.connected:
-                if not self._ha_started:
-                    _LOGGER.debug("Modbus client not yet connected (HA still starting)")
-                else:
-                    _LOGGER.warning("Modbus client not connected, attempting reconnect...")
+    async def async_shutdown(self) -> None:
+        """Cancel pending work and close the connection when the entry unloads."""
+        if self._closing:
+            return
+        self._closing = True
+        await super().async_shutdown()
 
-                # Close existing client if any
-                if self._client is not None:
-                    try:
-                        self._client.close()
-                    except Exception:
-                        pass
-                    self._client = None
+        if self._unsub_entity_registry is not None:
+            self._unsub_entity_registry()
+            self._unsub_entity_registry = None
 
-                # Create new client
-                try:
-                    self._client = ModbusTcpClient(host=self._host, port=self._port, timeout=60)
-                except Exception as e:
-                    _LOGGER.exception(f"Failed to create new Modbus client: {e}")
-                    return None
+        if self._write_task is not None and not self._write_task.done():
+            self._write_task.cancel()
+            try:
+                await self._write_task
+            except asyncio.CancelledError:
+                pass
+        self._write_task = None
+        for _, _, future in self._write_queue:
+            future.cancel()
+        self._write_queue = []
 
-                if not self._client.connect():
-                    _LOGGER.error("Modbus reconnect failed")
-                    return None
+        # Closing the client fails any request still in flight
+        self.close()
+        async_release_connection(self.hass, self._connection, self)
 
-            with self._modbus_lock:
-                resp = self._client.read_holding_registers(
-                    address=address,
-                    count=count,
-                    device_id=unit
-                )
+        if any(self._registers.valid):
+            await self._register_cache.async_save(self._register_cache_data())
+
+    async def _async_read_holding_registers(self, unit, address, count, verify=False, timeout=REQUEST_TIMEOUT, errors=False):
+        """Safely read holding registers with reconnection logic.
+
+        Polling reads are skipped during a write flush, the read-back of the
+        flush itself passes verify=True. timeout bounds the connect and the
+        request each. Modbus exception responses are returned instead of
+        None when errors=True.
+        """
+        if self._closing:
+            return None
+
+        # Block polling reads during write flush
+        if self._flush_running and not verify:
+            _LOGGER.debug("Read skipped because write flush is running")
+            return None
+        
+        started = time.monotonic()
+        success = False
+        try:
+            resp = await self._connection.async_execute(
+                self,
+                lambda client: client.read_holding_registers(address=address, count=count, device_id=unit),
+                timeout,
+            )
 
             # No response received
             if resp is None:
@@ -158,14 +302,11 @@ class AmberModbusHub(DataUpdateCoordinator[dict]):
                 )
                 # Force reconnect bij error frames - mogelijk gateway/warmtepomp communicatie probleem
                 # Dit helpt wanneer de IP-gateway nog bereikbaar is maar niet met de warmtepomp kan communiceren
-                _LOGGER.warning("Forcing reconnect due to Modbus error frame")
-                if self._client is not None:
-                    try:
-                        self._client.close()
-                    except Exception:
-                        pass
-                    self._client = None
-                return None
+                # Een gedeelde gateway blijft verbonden, de fout hoort bij deze unit
+                if not self._connection.shared:
+                    _LOGGER.warning("Forcing reconnect due to Modbus error frame")
+                    self._connection.reset()
+                return resp if errors else None
 
             # Response object exists but contains no registers
             if not hasattr(resp, "registers"):
@@ -177,21 +318,16 @@ class AmberModbusHub(DataUpdateCoordinator[dict]):
             
             # Update last successful read timestamp
             self._last_successful_read = datetime.now()
-            
+            success = True
             return resp
 
-        except (ConnectionException, ModbusIOException, ConnectionResetError, BrokenPipeError, OSError) as e:
+        except (ConnectionException, ModbusIOException, ConnectionResetError, BrokenPipeError, OSError, TimeoutError) as e:
             # Expected communication‑related errors
             _LOGGER.error(
-                f"Modbus communication error while reading {address}-{address+count-1}: {e}"
+                f"Modbus communication error while reading {address}-{address+count-1}: {e!r}"
             )
-            # Mark client as disconnected to force reconnect on next attempt
-            if self._client is not None:
-                try:
-                    self._client.close()
-                except Exception:
-                    pass
-                self._client = None
+            # Reopen the socket on the next attempt
+            self._connection.reset()
             return None
 
         except Exception as e:
@@ -201,106 +337,68 @@ class AmberModbusHub(DataUpdateCoordinator[dict]):
             )
             return None
 
+        finally:
+            self._stats.record_read((address, count), time.monotonic() - started if success else None)
+
     async def _async_update_data(self) -> dict:
         """Fetch Modbus data safely with clear logging and consistent return handling."""
-        # Check if we haven't received valid data for too long (5 minutes)
-        if self._last_successful_read is not None:
-            time_since_success = (datetime.now() - self._last_successful_read).total_seconds()
-            if time_since_success > 300:  # 5 minutes without successful reads
-                _LOGGER.warning(
-                    f"No successful reads for {int(time_since_success)}s (>5min), forcing reconnect"
-                )
-                if self._client is not None:
-                    try:
-                        self._client.close()
-                    except Exception:
-                        pass
-                    self._client = None
-        
-        # Start with previous data - only overwrite if we get new data
-        data: dict = {
-            **self.data_store.get("setting_data", {}),
-            **self.data_store.get("realtime_data", {}),
-        }
-        connection_status = "OK"
-        failed_details = []
+        # --- Read the tiers that are due ---
+        now = time.monotonic()
+        self._stats.start_cycle()
+        due = [tier for tier in POLL_TIERS if now >= self._tier_next_poll[tier]]
+        ranges = self._tier_read_plan(due)
+        _LOGGER.debug(f"Polling tiers {due}: {ranges}")
 
-        # --- Read settings data ---
-        settings_result = await self.hass.async_add_executor_job(self.read_modbus_setting_data)
-        if isinstance(settings_result, tuple):
-            settings, settings_failed_ranges = settings_result
-        else:
-            settings = settings_result
-            settings_failed_ranges = []
+        snapshot = self._registers.snapshot()
+        failed_ranges = await self._async_read_ranges(ranges)
 
-        if settings is None:
+        connection_status = "OK"
+        failed_details = []
+        # A write flush holds the gateway, that says nothing about its health
+        skipped = failed_ranges is None
+
+        if skipped:
+            # Keep the previous values and status, poll the same tiers on the next cycle
+            _LOGGER.debug("Read skipped because write flush is running, keeping previous values")
+            connection_status = (self.data or {}).get("connection_status", connection_status)
+        elif ranges and len(failed_ranges) == len(ranges):
             # Read skipped/failed (e.g. due to write flush) -> keep previous values
-            _LOGGER.debug("Settings read failed or skipped, keeping previous values")
-            settings = self.data_store.get("setting_data", {})
+            # and poll the same tiers again on the next cycle
+            _LOGGER.debug("Read failed or skipped, keeping previous values")
             connection_status = "Failed"
-            failed_details.append("Settings read completely failed")
-            settings_success = False
-        elif settings == {}:
-            _LOGGER.warning("Settings read returned empty data (decode error).")
-            # Keep previous values instead of overwriting with empty
-            settings = self.data_store.get("setting_data", {})
-            connection_status = "Failed"
-            failed_details.append("Settings decode error")
-            settings_success = False
+            failed_details.append("Read completely failed")
         else:
+            for tier in due:
+                self._tier_next_poll[tier] = now + self._tier_intervals[tier]
+
             # Check for partial failures
+            settings_failed_ranges = [r for r in failed_ranges if r[0] < FIRST_REALTIME_REGISTER]
+            realtime_failed_ranges = [r for r in failed_ranges if r[0] >= FIRST_REALTIME_REGISTER]
             if settings_failed_ranges:
-                connection_status = "Partial"
                 ranges_str = ','.join([f"{s}-{s+c-1}" for s, c in sorted(settings_failed_ranges)])
                 failed_details.append(f"Settings ranges: {ranges_str}")
-            settings_success = True
-
-        data.update(settings)
-
-        # --- Read realtime data ---
-        realtime_result = await self.hass.async_add_executor_job(self.read_modbus_realtime_data)
-        if isinstance(realtime_result, tuple):
-            realtime, realtime_failed_ranges = realtime_result
-        else:
-            realtime = realtime_result
-            realtime_failed_ranges = []
-
-        if realtime is None:
-            _LOGGER.debug("Realtime read failed or skipped, keeping previous values")
-            realtime = self.data_store.get("realtime_data", {})
-            connection_status = "Failed"
-            failed_details.append("Realtime read completely failed")
-            realtime_success = False
-        elif realtime == {}:
-            _LOGGER.warning("Realtime read returned empty data (decode error).")
-            realtime = self.data_store.get("realtime_data", {})
-            connection_status = "Failed"
-            failed_details.append("Realtime decode error")
-            realtime_success = False
-        else:
-            # Check for partial failures
             if realtime_failed_ranges:
-                if connection_status == "OK":
-                    connection_status = "Partial"
                 ranges_str = ','.join([f"{s}-{s+c-1}" for s, c in sorted(realtime_failed_ranges)])
                 failed_details.append(f"Realtime ranges: {ranges_str}")
-            realtime_success = True
 
-        data.update(realtime)
+        # Values of registers that could not be read for too long are dropped,
+        # the rest of the image still decodes
+        self._expire_stale_registers()
 
-        # Store last known good data for next round (only if new data was successfully read)
-        if settings_success:
-            self.data_store["setting_data"] = settings
-        if realtime_success:
-            self.data_store["realtime_data"] = realtime
+        # --- Decode the register image ---
+        data = self._decode_plan.decode(self._registers)
+        self._stats.end_cycle(time.monotonic() - now)
 
         # Set connection status
         if connection_status == "OK" and failed_details:
             connection_status = "Partial"
         data["connection_status"] = connection_status
+        data.update(self._diagnostic_data())
 
-        # Handle consecutive failures tracking
-        if connection_status == "Failed":
+        # Handle consecutive failures tracking, a skipped cycle leaves it as it is
+        if skipped:
+            pass
+        elif connection_status == "Failed":
             self._consecutive_failures += 1
             # Track when connection was first lost
             if self._consecutive_failures == 1:
@@ -359,411 +457,567 @@ class AmberModbusHub(DataUpdateCoordinator[dict]):
             self._connection_error_notified = False
             # Keep partial failure tracking to avoid re-notifying on same issues
 
-                
-        return data
-
-    def read_modbus_setting_data(self) -> tuple[dict, int]:
-        """Read all settings data."""
-        ranges = [
-            (0, 60), (60, 60), (120, 50), (170, 50),
-            (314, 11), (334, 7), (375, 2), (407, 53)
-        ]
-        all_registers = []
-        failed_ranges = []
-
-        _LOGGER.debug("Start reading settings data")
-
-        for start, count in ranges:
-            success = False
-            for attempt in range(MAX_READ_RETRIES):
-                resp = self._read_holding_registers(unit=1, address=start, count=count)
-                if resp is not None and not resp.isError() and hasattr(resp, "registers") and len(resp.registers) >= count:
-                    all_registers.extend(resp.registers)
-                    _LOGGER.debug(f"Read {len(resp.registers)} registers from {start}-{start+count-1} on attempt {attempt+1}")
-                    success = True
-                    break
-                else:
-                    _LOGGER.warning(f"Attempt {attempt+1} failed for range {start}-{start+count-1}")
-                    time.sleep(0.5)  # Short delay between retries
+        # Only keys decoded from registers that changed can have a new value
+        candidates = self._decode_plan.keys_for_registers(self._registers.changed_since(snapshot))
+        candidates.add("connection_status")
+        candidates.update(DIAGNOSTIC_KEYS)
+        self._changed_keys = self._diff_data(data, candidates)
 
-            if not success:
-                _LOGGER.error(f"Failed to read range {start}-{start+count-1} after {MAX_READ_RETRIES} attempts")
-                failed_ranges.append((start, count))
-                # Skip this range and continue with others
+        # Saved after the delay, or on the final write when HA stops
+        if connection_status != "Failed" and not self._register_cache_pending:
+            self._register_cache_pending = True
+            self._register_cache.async_delay_save(self._register_cache_data, REGISTER_CACHE_SAVE_DELAY)
+        return data
 
-        if failed_ranges:
-            _LOGGER.warning(f"Some ranges failed: {failed_ranges}. Proceeding with available data.")
+    def _diagnostic_data(self) -> dict:
+        """Return the values of the diagnostic sensors from the timing statistics."""
+        stats = self._stats
+        age = None
+        if self._last_successful_read is not None:
+            age = round((datetime.now() - self._last_successful_read).total_seconds())
+        return {
+            "poll_duration": milliseconds(stats.cycle_durations[-1]) if stats.cycle_durations else None,
+            "read_round_trip": milliseconds(percentile(stats.all_read_durations(), 0.5)),
+            "read_retries": stats.cycle_retries[-1] if stats.cycle_retries else None,
+            "write_queue_depth": len(self._write_queue),
+            "write_flush_duration": milliseconds(stats.flush_durations[-1]) if stats.flush_durations else None,
+            "last_read_age": age,
+        }
 
-        if not all_registers:
-            _LOGGER.error("No settings data could be read")
-            return None, failed_ranges
+    def diagnostic_attributes(self, key: str) -> dict | None:
+        """Return the rolling window statistics shown as attributes of a diagnostic sensor."""
+        stats = self._stats
+        if key == "poll_duration":
+            return stats.summary(stats.cycle_durations)
+        if key == "read_round_trip":
+            return {**stats.summary(stats.all_read_durations()), "ranges": stats.read_summary()}
+        if key == "read_retries":
+            return {
+                "p95": percentile(stats.cycle_retries, 0.95),
+                "total": stats.retries,
+                "reads": stats.reads,
+                "failed_reads": stats.read_failures,
+            }
+        if key == "write_flush_duration":
+            return stats.summary(stats.flush_durations)
+        return None
+
+    def diagnostics(self) -> dict:
+        """Return the register image, read plan, health and statistics for the config entry diagnostics."""
+        now = time.monotonic()
+        health = self._range_health
+        return {
+            "unit_id": self._unit,
+            "connection": {
+                "transport": self._connection.transport,
+                "baudrate": self._connection.baudrate,
+                "shared": self._connection.shared,
+                "circuit": self._retry_policy.state,
+                "consecutive_failed_cycles": self._consecutive_failures,
+                "last_successful_read": self._last_successful_read.isoformat() if self._last_successful_read else None,
+            },
+            "registers": self._registers.as_dict(),
+            "data": self.data,
+            "read_plan": {
+                tier: {
+                    "interval": self._tier_intervals[tier],
+                    "due_in": round(max(0.0, self._tier_next_poll[tier] - now), 1),
+                    "blocks": [block_name(block) for block in self._tier_read_plan((tier,))],
+                }
+                for tier in POLL_TIERS
+            },
+            "range_health": {
+                "blocks": {block_name(block): dict(stats) for block, stats in sorted(health.blocks.items())},
+                "quarantined": {address: round(max(0.0, retry_at - now)) for address, retry_at in sorted(health.quarantined.items())},
+            },
+            "statistics": self._stats.as_dict(),
+            "write_queue_depth": len(self._write_queue),
+            "write_log": list(self._stats.write_log),
+        }
 
-        _LOGGER.debug("Finished reading settings data")
+    @callback
+    def _register_cache_data(self) -> dict:
+        """Return the register image as stored in the register cache."""
+        self._register_cache_pending = False
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            "registers": self._registers.as_dict(),
+        }
 
-        # --- Decode phase ---
-        try:
-            newdecoder = ModbusTcpClient.convert_from_registers(
-                all_registers, data_type=ModbusTcpClient.DATATYPE.INT16
-            )
+    def _expire_stale_registers(self) -> None:
+        """Drop the values of registers that were not read for too long for their tier."""
+        now = time.monotonic()
+        for tier in POLL_TIERS:
+            max_age = max(STALE_AFTER_INTERVALS * self._tier_intervals[tier], STALE_REGISTER_AGE)
+            self._registers.expire(self._tier_registers[tier], now - max_age)
+
+    async def async_load_register_cache(self) -> bool:
+        """Publish data decoded from the last known register image.
+
+        The image kept in hass.data over a reload is used, otherwise the
+        register cache saved before the last restart. Cached registers count
+        as read when the cache was saved, so values that are too old for
+        their tier are dropped right away. Returns False when no registers
+        are left.
+        """
+        if not any(self._registers.valid):
+            cache = await self._register_cache.async_load()
+            if not cache or not cache.get("registers"):
+                return False
+            saved_at = dt_util.parse_datetime(cache.get("saved_at") or "")
+            if saved_at is None:
+                return False
+            age = max(0.0, (dt_util.utcnow() - saved_at).total_seconds())
+            _LOGGER.debug(f"Loaded register cache saved at {saved_at} ({age:.0f}s ago)")
+            read_at = time.monotonic() - age
+            for address, value in cache["registers"].items():
+                address = int(address)
+                if address < len(self._registers):
+                    self._registers.update(address, [value & 0xFFFF], read_at)
+
+        self._expire_stale_registers()
+        if not any(self._registers.valid):
+            return False
+
+        data = self._decode_plan.decode(self._registers)
+        data["connection_status"] = "Cached"
+        self.async_set_updated_data(data)
+        return True
+
+    def _diff_data(self, data: dict, candidates=None) -> set[str] | None:
+        """Return the keys whose value differs from the current data, None if all did.
+
+        When candidates is given only those keys are compared.
+        """
+        previous = self.data
+        if not previous:
+            return None
+        missing = object()
+        if candidates is None:
+            candidates = data.keys() | previous.keys()
+        return {key for key in candidates if previous.get(key, missing) != data.get(key, missing)}
 
-            data = {}
-            register_map = {}
-            idx = 0
-
-            # Build index map
-            for start, count in ranges:
-                if (start, count) not in failed_ranges:
-                    for i in range(count):
-                        reg = start + i
-                        register_map[reg] = idx
-                        idx += 1
-
-            # Registers to skip (decoded separately)
-            skip = {
-                9, 18, 66, 71, 73, 119, 120, 121, 122,
-                143, 144, 145, 146, 147, 148, 149, 150,
-                218, 137, 202, 203, 126, 323, 324, 339
-            }
+    @callback
+    def async_set_updated_data(self, data: dict) -> None:
+        """Publish data pushed outside a poll, notifying only the changed keys."""
+        self._changed_keys = self._diff_data(data)
+        super().async_set_updated_data(data)
 
-            # Normal registers
-            for reg, index in register_map.items():
-                if reg not in skip and index < len(newdecoder):
-                    data[str(reg)] = newdecoder[index]
-
-            # Status registers with lookup tables
-            STATUS_MAPS = {
-                "ON_OFF_STATUS": [
-                    9, 18, 66, 71, 73, 120, 121, 122,
-                    143, 144, 145, 146, 147, 148, 149, 150,
-                    218, 323, 324, 339
-                ],
-                "MODE_SIGNAL_TYPE": [119, 203],
-                "PUMP_TYPE": [137],
-                "MODE_SIGNAL_OUTPUT": [202],
-                "DISPLAY_TIME": [126]
-            }
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the entities whose key changed in the last update.
+
+        Entities register with their description key as listener context.
+        Listeners without a context, and every listener after a failed update
+        or availability change, are always notified.
+        """
+        changed = self._changed_keys
+        self._changed_keys = None
+        if changed is None or self.last_update_success != self._last_notified_success:
+            self._last_notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
 
-            for category, regs in STATUS_MAPS.items():
-                decode_dict = globals().get(category)
-                for reg in regs:
-                    if reg in register_map:
-                        idx = register_map[reg]
-                        val = newdecoder[idx]
-                        data[str(reg)] = decode_dict[val] if decode_dict and val in decode_dict else val
+        if not changed:
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    async def _async_read_ranges(self, ranges) -> list[tuple[int, int]] | None:
+        """Read register blocks into the register image, returning the failed blocks.
+
+        Retries, backoff, the time budget of the cycle and pausing a dead
+        gateway are decided by the retry policy. Returns None when the cycle
+        is skipped because a write flush is running; a cycle skipped by the
+        open circuit fails every block.
+        """
+        policy = self._retry_policy
+        policy.start_cycle()
+
+        if not ranges:
+            return []
+        if self._flush_running:
+            # Reads are skipped during a write flush, that is no gateway failure
+            _LOGGER.debug("Read skipped because write flush is running")
+            return None
 
-            return data, failed_ranges
+        state = policy.state
+        if state == CIRCUIT_OPEN:
+            _LOGGER.debug("Modbus gateway not responding, skipping this poll")
+            return list(ranges)
+        if state == CIRCUIT_HALF_OPEN:
+            # Probe the gateway with one cheap read before polling everything
+            if not await self._async_device_answers():
+                policy.record_failure()
+                return list(ranges)
+            policy.record_success()
 
-        except Exception as e:
-            _LOGGER.exception(f"Unexpected error decoding settings data: {e}")
-            return {}, failed_ranges
-
-    def read_modbus_realtime_data(self) -> tuple[dict, int]:
-        """Read realtime sensor values."""
-        ranges = [
-            (499, 48),
-            (703, 13)
-        ]
-        all_registers = []
         failed_ranges = []
 
-        _LOGGER.debug("Start reading realtime data")
+        _LOGGER.debug("Start reading register ranges")
 
-        # --- Read all Modbus ranges ---
         for start, count in ranges:
             success = False
-            for attempt in range(MAX_READ_RETRIES):
-                resp = self._read_holding_registers(unit=1, address=start, count=count)
+            attempt = 0
+            while not self._closing and policy.remaining() > 0:
+                attempt += 1
+                resp = await self._async_read_holding_registers(
+                    unit=self._unit, address=start, count=count, timeout=min(REQUEST_TIMEOUT, policy.remaining())
+                )
                 if resp is not None and not resp.isError() and hasattr(resp, "registers") and len(resp.registers) >= count:
-                    all_registers.extend(resp.registers)
-                    _LOGGER.debug(f"Read {len(resp.registers)} registers from {start}-{start+count-1} on attempt {attempt+1}")
+                    self._registers.update(start, resp.registers[:count])
+                    _LOGGER.debug(f"Read {len(resp.registers)} registers from {start}-{start+count-1} on attempt {attempt}")
                     success = True
                     break
-                else:
-                    _LOGGER.warning(f"Attempt {attempt+1} failed for range {start}-{start+count-1}")
-                    time.sleep(0.5)
+
+                if self._flush_running:
+                    # A write flush started during the cycle, the read was not sent
+                    return None
+                delay = policy.backoff(attempt)
+                if delay is None or self._closing:
+                    break
+                _LOGGER.warning(f"Attempt {attempt} failed for range {start}-{start+count-1}, retrying in {delay:.2f}s")
+                self._stats.record_retry()
+                await asyncio.sleep(delay)
 
             if not success:
-                _LOGGER.error(f"Failed to read range {start}-{start+count-1} after {MAX_READ_RETRIES} attempts")
+                _LOGGER.error(f"Failed to read range {start}-{start+count-1} after {attempt} attempts")
                 failed_ranges.append((start, count))
+                # Skip this range and continue with others
+
+        if len(failed_ranges) == len(ranges):
+            # Nothing could be read, that is the gateway and not a block
+            policy.record_failure()
+        else:
+            policy.record_success()
+            for block in ranges:
+                self._range_health.record(block, block not in failed_ranges)
+            await self._async_heal_ranges(failed_ranges)
 
         if failed_ranges:
-            _LOGGER.warning(f"Some realtime ranges failed: {failed_ranges}. Proceeding with available data.")
+            _LOGGER.warning(f"Some ranges failed: {failed_ranges}. Proceeding with available data.")
 
-        if not all_registers:
-            _LOGGER.error("No realtime data could be read")
-            return None, failed_ranges
+        _LOGGER.debug("Finished reading register ranges")
+        return failed_ranges
 
-        # --- Decode phase ---
-        try:
-            newdecoder = ModbusTcpClient.convert_from_registers(
-                all_registers, data_type=ModbusTcpClient.DATATYPE.INT16
-            )
+    async def _async_read_block_once(self, start: int, count: int) -> bool | None:
+        """Read a block once within the cycle budget into the register image.
 
-            data = {}
-
-            # Build index map
-            register_map = {}
-            idx = 0
-            for start, count in ranges:
-                if (start, count) not in failed_ranges:
-                    for i in range(count):
-                        reg = start + i
-                        register_map[reg] = idx
-                        idx += 1
-
-            # --- Decode status bitfield (499) ---
-            bit_messages = {
-                0: "DHW Standby",
-                1: "Heating Standby",
-                2: "Cooling Standby",
-                3: "DHW in progress",
-                4: "Heating in progress",
-                5: "Cooling in progress",
-                6: "Timer in progress"
-            }
+        Returns True when the block was read, False when the device rejected
+        its registers with a Modbus exception, and None when there was no
+        usable answer, e.g. a timeout or a busy device.
+        """
+        timeout = min(REQUEST_TIMEOUT, self._retry_policy.remaining())
+        if self._closing or timeout <= 0:
+            return None
+        resp = await self._async_read_holding_registers(
+            unit=self._unit, address=start, count=count, timeout=timeout, errors=True
+        )
+        if resp is None:
+            return None
+        if resp.isError():
+            return False if getattr(resp, "exception_code", None) in REGISTER_EXCEPTION_CODES else None
+        if len(resp.registers) < count:
+            return None
+        self._registers.update(start, resp.registers[:count])
+        return True
+
+    async def _async_device_answers(self) -> bool:
+        """Read PROBE_REGISTER once, returning True when the device answered.
+
+        A register exception is an answer too, so the probe still works when
+        the device rejects the probe register or bisection quarantined it.
+        """
+        return await self._async_read_block_once(PROBE_REGISTER, 1) is not None
+
+    async def _async_bisect_block(self, start: int, count: int) -> list[int] | None:
+        """Split a failing block in halves until the unreadable addresses are isolated.
+
+        The halves that can be read update the register image. Only registers
+        the device rejects with a Modbus exception are reported. Returns None
+        when a half got no answer, which may be a lost reply, or when the
+        cycle budget ran out before the block was fully bisected.
+        """
+        half = count // 2
+        bad = []
+        for part_start, part_count in ((start, half), (start + half, count - half)):
+            result = await self._async_read_block_once(part_start, part_count)
+            if result:
+                continue
+            if result is None or self._retry_policy.remaining() <= 0 or self._closing or self._flush_running:
+                return None
+            if part_count == 1:
+                bad.append(part_start)
+                continue
+            part_bad = await self._async_bisect_block(part_start, part_count)
+            if part_bad is None:
+                return None
+            bad.extend(part_bad)
+        return bad
+
+    async def _async_heal_ranges(self, failed_ranges) -> None:
+        """Bisect blocks that keep failing and re-probe quarantined registers.
+
+        Only called when the gateway answered in this cycle, so failures are
+        caused by the registers in a block and not by the connection. A block
+        of one register is quarantined after failing in several cycles in a
+        row; longer blocks only lose the registers bisection finds rejected.
+        """
+        health = self._range_health
+        quarantine_changed = False
+
+        for start, count in failed_ranges:
+            if not health.needs_bisect((start, count)):
+                continue
+            if count == 1:
+                bad = [start]
+            else:
+                _LOGGER.info(f"Range {start}-{start+count-1} keeps failing, bisecting")
+                bad = await self._async_bisect_block(start, count)
+                if bad is None:
+                    continue  # No answer or out of time, try again next cycle
+            # Make sure the gateway still answers, a dropped connection is no bad register
+            if bad and not await self._async_device_answers():
+                continue
+            health.reset((start, count))
+            if bad:
+                health.quarantine(bad)
+                for address in bad:
+                    if address < len(self._registers):
+                        self._registers.invalidate(address, 1)
+                quarantine_changed = True
+
+        for address in health.due_probes():
+            if self._retry_policy.remaining() <= 0:
+                break
+            result = await self._async_read_block_once(address, 1)
+            if result is None:
+                continue  # No answer, probe again next cycle
+            health.probe_result(address, result)
+            quarantine_changed |= result
+
+        if quarantine_changed:
+            self._tier_plans = {}
+            for tier in POLL_TIERS:
+                _LOGGER.debug(f"Read plan {tier} tier: {self._tier_read_plan((tier,))}")
 
-            status_value = newdecoder[register_map[499]]
-            status_text = self.get_highest_bit_message(status_value, bit_messages)
-            data["499"] = status_text if status_text else ""
-
-            # --- Decode realtime values ---
-            realtime_keys = {
-                501: (register_map[501], 0.01, "V{}-T{}"),
-                502: (register_map[502], None, None),
-                503: (register_map[503], None, None),
-                504: (register_map[504], 0.01, "V{}"),
-                505: (register_map[505], 0.1, None),
-                506: (register_map[506], 0.1, None),
-                507: (register_map[507], 0.1, None),
-                508: (register_map[508], 0.1, None),
-                509: (register_map[509], 0.1, None),
-                510: (register_map[510], 0.1, None),
-                511: (register_map[511], 0.1, None),
-                512: (register_map[512], None, None),
-                513: (register_map[513], None, None),
-                515: (register_map[515], None, None),
-                516: (register_map[516], None, None),
-                517: (register_map[517], 0.1, None),
-                518: (register_map[518], 0.1, None),
-                519: (register_map[519], 0.1, None),
-                520: (register_map[520], 0.1, None),
-                521: (register_map[521], 0.1, None),
-                522: (register_map[522], 0.1, None),
-                523: (register_map[523], 0.1, None),
-                524: (register_map[524], 0.1, None),
-                525: (register_map[525], 0.1, None),
-                526: (register_map[526], None, None),
-                527: (register_map[527], None, None),
-                528: (register_map[528], 0.1, None),
-                529: (register_map[529], None, None),
-                531: (register_map[531], 0.1, None),
-                537: (register_map[537], 0.1, None),
-                538: (register_map[538], 0.1, None),
-                539: (register_map[539], 0.1, None),
-                544: (register_map[544], None, None),
-                545: (register_map[545], None, None),
-                546: (register_map[546], None, None),
-            }
+    @callback
+    def write_registers(self, address: int, value) -> asyncio.Future:
+        """Queue register writes and coalesce them within the debounce window.
+
+        Returns a future for this write that resolves once the device reports
+        the written values, or fails with an AmberWriteError giving the reason.
+        It is cancelled when the integration unloads before the write is done.
+        """
+        future = self.hass.loop.create_future()
+        if self._closing:
+            future.cancel()
+            return future
+
+        # Normalize payloads to one register value per address
+        values = value if isinstance(value, list) else [value]
+        # Force to int (HA sometimes sends strings/floats)
+        self._write_queue.append((address, [int(v) for v in values], future))
+
+        # Restart the debounce window of the running writer, or start one
+        self._write_event.set()
+        if self._write_task is None or self._write_task.done():
+            self._write_task = self.hass.async_create_background_task(
+                self._async_write_worker(), f"{DOMAIN}_{self.name}_write_queue"
+            )
+        return future
 
-            for key, (index, scale, fmt) in realtime_keys.items():
-                if index < len(newdecoder):
-                    val = newdecoder[index]
-
-                    if scale:
-                        val = round(val * scale, 2)
-
-                    if fmt:
-                        if key == 501:
-                            t_raw = newdecoder[register_map[503]]
-                            t = t_raw >> 5
-                            data[str(key)] = fmt.format(str(val), t)
-                        else:
-                            data[str(key)] = fmt.format(val)
-                    else:
-                        data[str(key)] = val
-
-            # --- delta-T ---
-            deltaT = newdecoder[register_map[505]] - newdecoder[register_map[506]]
-            data["delta-T"] = round(abs(deltaT) * 0.1, 2)
-
-            # --- Status decoding ---
-            status = {
-                "ON_OFF_STATUS": {
-                    "530": register_map[530], "532": register_map[532],
-                    "533": register_map[533], "534": register_map[534],
-                    "535": register_map[535], "536": register_map[536]
-                },
-                "CURRENT_OPERATION_MODE": {"514": register_map[514]},
-                "LOGIN_STATUS": {"500": register_map[500]},
-            }
+    @callback
+    def write_value(self, key: str, value) -> asyncio.Future:
+        """Queue a write of a value to a data key, encoded by the register map.
+
+        Raises ValueError when the key cannot be written or the value does not
+        fit its register; otherwise behaves like write_registers.
+        """
+        address, words = self._decode_plan.encode(key, value)
+        return self.write_registers(address, words)
+
+    async def async_flush_writes(self) -> None:
+        """Wait until the write queue has been flushed."""
+        if self._write_task is not None and not self._write_task.done():
+            await asyncio.shield(self._write_task)
+
+    async def _async_write_worker(self) -> None:
+        """Flush the write queue once no new writes arrived for the debounce window."""
+        writes = []
+        try:
+            while self._write_queue:
+                # Every new write restarts the debounce window
+                while True:
+                    self._write_event.clear()
+                    try:
+                        async with asyncio.timeout(WRITE_DEBOUNCE):
+                            await self._write_event.wait()
+                    except TimeoutError:
+                        break
 
-            for category, statuses in status.items():
-                decode_dict = globals().get(category)
-                for key, index in statuses.items():
-                    if index < len(newdecoder):
-                        val = newdecoder[index]
-                        if decode_dict and val in decode_dict:
-                            data[key] = decode_dict[val]
-
-            # --- Failure and active status bits ---
-            status_bits = {
-                "ACTIVE_STATUS": {
-                    "P04": (register_map[499] + 41, 3),
-                    "P07": (register_map[499] + 41, 6),
-                    "P12": (register_map[499] + 41, 11),
-                },
-                "FAILURE_STATUS": {
-                    "P01": (register_map[499] + 41, 0), "P02": (register_map[499] + 41, 1),
-                    "P03": (register_map[499] + 41, 2), "P05": (register_map[499] + 41, 4),
-                    "P06": (register_map[499] + 41, 5),
-                    "P08": (register_map[499] + 41, 7), "P09": (register_map[499] + 41, 8),
-                    "P10": (register_map[499] + 41, 9), "P11": (register_map[499] + 41, 10),
-                    "P13": (register_map[499] + 41, 12),
-
-                    "F01": (register_map[499] + 42, 5), "F02": (register_map[499] + 42, 6),
-                    "F03": (register_map[499] + 42, 7), "F04": (register_map[499] + 42, 8),
-                    "F05": (register_map[499] + 42, 9), "F06": (register_map[499] + 42, 10),
-                    "F07": (register_map[499] + 42, 11), "F09": (register_map[499] + 42, 13),
-                    "F10": (register_map[499] + 42, 14), "F11": (register_map[499] + 42, 15),
-
-                    "F12": (register_map[499] + 43, 0), "F13": (register_map[499] + 43, 1),
-                    "F14": (register_map[499] + 43, 2), "F15": (register_map[499] + 43, 3),
-                    "F16": (register_map[499] + 43, 4), "F17": (register_map[499] + 43, 5),
-                    "F18": (register_map[499] + 43, 6), "F21": (register_map[499] + 43, 7),
-                    "F22": (register_map[499] + 43, 8), "F25": (register_map[499] + 43, 9),
-                    "F27": (register_map[499] + 43, 10), "F28": (register_map[499] + 43, 11),
-                    "F29": (register_map[499] + 43, 12), "F30": (register_map[499] + 43, 13),
-
-                    "E01": (register_map[499] + 41, 13), "E02": (register_map[499] + 41, 14),
-                    "E03": (register_map[499] + 41, 15), "E04": (register_map[499] + 42, 0),
-                    "E05": (register_map[499] + 42, 1), "E06": (register_map[499] + 42, 2),
-                    "E07": (register_map[499] + 42, 3), "E08": (register_map[499] + 42, 4),
-
-                    "S01": (register_map[499] + 43, 14), "S02": (register_map[499] + 43, 15),
-                    "S03": (register_map[499] + 44, 0),  "S04": (register_map[499] + 44, 1),
-                    "S05": (register_map[499] + 44, 2),  "S06": (register_map[499] + 44, 3),
-                    "S07": (register_map[499] + 44, 4),  "S08": (register_map[499] + 44, 5),
-                    "S09": (register_map[499] + 44, 6),  "S10": (register_map[499] + 44, 7),
-                    "S11": (register_map[499] + 44, 8),  "S13": (register_map[499] + 44, 9),
-                }
-            }
+                writes, self._write_queue = self._write_queue, []
+                try:
+                    failures = await self._async_flush_write_queue(writes)
+                except Exception as e:
+                    # Fail this batch, the writes queued meanwhile are flushed next
+                    _LOGGER.exception(f"Unexpected error in write queue: {e}")
+                    reason = f"unexpected error: {e}"
+                    failures = {
+                        register: reason
+                        for address, values, _ in writes
+                        for register in range(address, address + len(values))
+                    }
+                self._resolve_writes(writes, failures)
+                writes = []
+
+        except asyncio.CancelledError:
+            _LOGGER.debug("Write queue cancelled")
+            raise
 
-            for category, failures in status_bits.items():
-                decode_dict = globals().get(category)
-                for key, (index, shift) in failures.items():
-                    if index < len(newdecoder):
-                        val = (newdecoder[index] >> shift) & 1
-                        if decode_dict and val in decode_dict:
-                            data[key] = decode_dict[val]
-
-            # --- Setpoints (703–715) ---
-            setpoint_scales = {
-                703: 0.1, 704: 0.1, 705: 1, 706: 1, 707: 1, 708: 1, 709: 1,
-                710: 1, 711: 1, 712: 1, 713: 1, 714: 0.1, 715: 0.1
+        finally:
+            for _, _, future in writes:
+                future.cancel()
+
+    @staticmethod
+    def _resolve_writes(writes, failures: dict[int, str]) -> None:
+        """Resolve the future of every write from the outcome per register.
+
+        A write that was superseded by a later write to the same register
+        shares the outcome of that register.
+        """
+        for address, values, future in writes:
+            if future.done():
+                continue
+            errors = {
+                failures[register] for register in range(address, address + len(values)) if register in failures
             }
+            if errors:
+                future.set_exception(AmberWriteError(
+                    f"Writing {values} to register {address} failed: {', '.join(sorted(errors))}"
+                ))
+            else:
+                future.set_result(None)
+
+    async def _async_write_run(self, address: int, values: list[int]) -> bool:
+        """Write a run of contiguous registers in one transaction, returning True on success.
+
+        A single register is written with FC6 (write register), longer runs
+        with FC16 (write multiple registers).
+        """
+        unit = self._unit
+        if len(values) == 1:
+            request = lambda client: client.write_register(address, values[0], device_id=unit)
+        else:
+            request = lambda client: client.write_registers(address, values, device_id=unit)
 
-            for reg, scale in setpoint_scales.items():
-                if reg in register_map:
-                    sp_idx = register_map[reg]
-                    if sp_idx < len(newdecoder):
-                        val = newdecoder[sp_idx]
-                        data[str(reg)] = round(val * scale, 2)
-
-            _LOGGER.debug(f"Finished reading realtime data")
-            return data, failed_ranges
-
-        except Exception as e:
-            _LOGGER.exception(f"Unexpected error decoding realtime data: {e}")
-            return {}, failed_ranges
-    
-    def get_highest_bit_message(self, register_value: int, bit_messages: dict) -> str:
-        highest_bit = max((bit for bit in bit_messages if register_value & (1 << bit)), default=None)
-        return bit_messages[highest_bit] if highest_bit is not None else ""
-
-    def write_registers(self, address: int, value) -> None:
-        """Queue register writes and coalesce them within 400ms."""
         try:
-            # Normalize list payloads
-            if isinstance(value, list):
-                if len(value) == 1:
-                    value = value[0]  # [31] → 31
-                else:
-                    # Multiple values → sequential writes
-                    for i, v in enumerate(value):
-                        self.write_registers(address + i, v)
-                    return
-
-            # Force to int (HA sometimes sends strings/floats)
-            value = int(value)
-
-            with self._lock:
-                self._write_queue.append((address, value))
-
-                if self._write_timer is not None:
-                    self._write_timer.cancel()
-
-                self._write_timer = threading.Timer(0.7, self._flush_write_queue)
-                self._write_timer.start()
-
-        except Exception as e:
-            _LOGGER.exception(f"Unexpected error queuing write: {e}")
-
-    def _flush_write_queue(self):
-        """Write all queued registers sequentially, then refresh."""
-        # If a flush is already running, mark that another flush is needed
-        if self._flush_running:
-            self._flush_pending = True
-            _LOGGER.debug("Flush already running, marking pending flush")
-            return
-
+            result = await self._connection.async_execute(self, request)
+        except (ConnectionException, ModbusIOException, OSError, TimeoutError) as e:
+            _LOGGER.error(f"Modbus write failed at address {address} with values {values}: {e!r}")
+            self._connection.reset()
+            return False
+
+        if result.isError():
+            _LOGGER.error(f"Modbus write failed at address {address} with values {values}: {result}")
+            return False
+        return True
+
+    async def _async_flush_write_queue(self, writes) -> dict[int, str]:
+        """Write queued registers in contiguous runs and read them back.
+
+        Returns the reason of failure for every register that was not written
+        or did not read back the written value.
+        """
+        # Deduplicate: last write per address wins
+        dedup = {}
+        for address, values, _ in writes:
+            for offset, value in enumerate(values):
+                dedup[address + offset] = value & 0xFFFF
+
+        failures = {}
+        started = time.monotonic()
+        # Block polling reads while the device processes the writes
         self._flush_running = True
-
         try:
-            while True:
-                with self._lock:
-                    # Deduplicate: last write per address wins
-                    dedup = {}
-                    for addr, val in self._write_queue:
-                        dedup[addr] = val
-
-                    writes = list(dedup.items())
+            # One transaction per run of contiguous registers
+            written = {}
+            runs = contiguous_runs(dedup)
+            for address, values in runs:
+                if await self._async_write_run(address, values):
+                    _LOGGER.debug(f"Successfully wrote registers {address}-{address+len(values)-1} with values {values}")
+                    written.update(zip(range(address, address + len(values)), values))
+                else:
+                    failures.update(dict.fromkeys(range(address, address + len(values)), "write rejected or not sent"))
 
-                    self._write_queue = []
-                    self._write_timer = None
-                    self._flush_pending = False
+            confirmed = await self._async_verify_writes(written) if written else set()
+        finally:
+            self._flush_running = False
 
-                # No writes? Stop.
-                if not writes:
+        for address in written:
+            if address not in confirmed:
+                failures[address] = "value not confirmed by the device"
+        duration = time.monotonic() - started
+        self._stats.record_flush(duration)
+        for address, values in runs:
+            errors = {failures[register] for register in range(address, address + len(values)) if register in failures}
+            self._stats.record_write(address, values, ", ".join(sorted(errors)) or "confirmed", duration)
+
+        if written:
+            self._async_publish_registers(written)
+        return failures
+
+    async def _async_verify_writes(self, written: dict[int, int]) -> set[int]:
+        """Read back written registers until they hold the written values.
+
+        Only the written registers are read, with a short backoff between
+        attempts, until all of them match or WRITE_VERIFY_TIMEOUT passes. No
+        read-back runs past that deadline, so polling is never blocked for
+        longer. Returns the confirmed addresses; the register image holds the
+        values the device reported.
+        """
+        pending = {address for address in written if address < len(self._registers)}
+        # Registers outside the register image cannot be read back
+        confirmed = set(written) - pending
+        delay = WRITE_VERIFY_INITIAL_DELAY
+        deadline = time.monotonic() + WRITE_VERIFY_TIMEOUT
+
+        while pending and not self._closing:
+            await asyncio.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            for start, count in build_read_plan(pending):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     break
-
-                # Perform writes
-                for address, value in writes:
-                    with self._modbus_lock:
-                        result = self._client.write_register(address, value, device_id=1)
-
-                    if result.isError():
-                        _LOGGER.error(f"Modbus write failed at address {address} with value {value}")
-                        continue
-
-                    _LOGGER.debug(f"Successfully wrote to register {address} with value {value}")
-                    time.sleep(0.1)
-
-                # Allow heat pump to process
-                time.sleep(2)
-
-                # Refresh HA
-                self.hass.loop.call_soon_threadsafe(
-                    lambda: asyncio.create_task(self.async_request_refresh())
+                resp = await self._async_read_holding_registers(
+                    unit=self._unit, address=start, count=count, verify=True,
+                    timeout=min(WRITE_VERIFY_READ_TIMEOUT, remaining),
                 )
-                self.hass.loop.call_soon_threadsafe(self._schedule_refresh)
+                if resp is None or resp.isError() or len(resp.registers) < count:
+                    continue
+                self._registers.update(start, resp.registers[:count])
+                for address, value in zip(range(start, start + count), resp.registers):
+                    if address in pending and value == written[address]:
+                        pending.discard(address)
+                        confirmed.add(address)
 
-                # If new writes arrived during flush, loop again
-                if not self._flush_pending:
-                    break
+            if pending and time.monotonic() >= deadline:
+                _LOGGER.warning(f"Registers {sorted(pending)} did not confirm the written values within {WRITE_VERIFY_TIMEOUT}s")
+                break
+            delay = min(delay * 2, WRITE_VERIFY_MAX_DELAY)
 
-        except Exception as e:
-            _LOGGER.exception(f"Unexpected error during write flush: {e}")
+        return confirmed
 
-        finally:
-            self._flush_running = False
-  
\ No newline at end of file
+    @callback
+    def _async_publish_registers(self, registers) -> None:
+        """Publish the keys decoded from the given registers without polling."""
+        if self.data is None:
+            return
+        data = self._decode_plan.decode(self._registers)
+        data["connection_status"] = self.data.get("connection_status")
+        data.update(self._diagnostic_data())
+        self._changed_keys = self._diff_data(
+            data, self._decode_plan.keys_for_registers(registers) | set(DIAGNOSTIC_KEYS)
+        )
+        self.data = data
+        self.async_update_listeners()
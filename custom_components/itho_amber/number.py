@@ -7,7 +7,6 @@ from homeassistant.components.number import NumberEntity
 
 from homeassistant.const import CONF_NAME
 import homeassistant.util.dt as dt_util
-from pymodbus.client import ModbusTcpClient
 
 from .const import (
     ATTR_MANUFACTURER,
@@ -66,7 +65,7 @@ class AmberNumber(CoordinatorEntity, NumberEntity):
         self.entity_description: AmberModbusNumberEntityDescription = description
         self._hub = hub
 
-        super().__init__(coordinator=hub)
+        super().__init__(coordinator=hub, context=description.key)
 
     @property
     def name(self):
@@ -115,10 +114,6 @@ class AmberNumber(CoordinatorEntity, NumberEntity):
         min_value = self.entity_description.native_min_value 
         return  min_value  
 
-    def set_native_value(self, value: int) -> None:
+    async def async_set_native_value(self, value: int) -> None:
         """Set new value and write to modbus."""
-        address = int(self.entity_description.key)
-        payload = ModbusTcpClient.convert_to_registers(int(value), 
-        data_type=ModbusTcpClient.DATATYPE.INT16, word_order="big")
-       
-        self._hub.write_registers(address, payload)
\ No newline at end of file
+        await self._hub.write_value(self.entity_description.key, int(value))
\ No newline at end of file
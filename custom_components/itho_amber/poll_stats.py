@@ -0,0 +1,163 @@
+"""Timing statistics of the Itho Amber hub.
+
+The hub keeps rolling windows of its last poll cycles, block reads and
+write flushes in memory, together with a log of its last writes. Its
+diagnostic sensors and the config entry diagnostics show them, so a
+gateway that slows down is noticed before it stops answering.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+# Samples kept per rolling window
+STATS_WINDOW = 120
+# Writes kept in the write log
+WRITE_LOG_SIZE = 50
+# Upper bounds in milliseconds of the latency histogram buckets
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def percentile(samples: Iterable[float], fraction: float) -> float | None:
+    """Return the nearest-rank percentile of samples, None when there are none."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def milliseconds(seconds: float | None) -> float | None:
+    """Return a duration in seconds as rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def histogram(samples: Iterable[float], buckets: Iterable[float] = LATENCY_BUCKETS) -> dict[str, int]:
+    """Return how many durations in seconds fall in each millisecond bucket."""
+    buckets = tuple(buckets)
+    counts = dict.fromkeys([*(f"<={bound} ms" for bound in buckets), f">{buckets[-1]} ms"], 0)
+    labels = list(counts)
+    for sample in samples:
+        ms = sample * 1000
+        index = next((i for i, bound in enumerate(buckets) if ms <= bound), len(buckets))
+        counts[labels[index]] += 1
+    return counts
+
+
+def block_name(block: tuple[int, int]) -> str:
+    """Return a (start, count) read block as "first-last" register."""
+    start, count = block
+    return f"{start}-{start + count - 1}"
+
+
+class PollStats:
+    """Rolling timing windows and counters of one hub.
+
+    Durations are in seconds. Only successful reads are timed, failed reads
+    are counted. A cycle that sent no request, because a write flush was
+    running or the circuit was open, is not recorded.
+    """
+
+    def __init__(self, window: int = STATS_WINDOW) -> None:
+        """Initialize empty windows."""
+        self.window = window
+        self.cycle_durations: deque[float] = deque(maxlen=window)
+        self.cycle_retries: deque[int] = deque(maxlen=window)
+        # (start, count) -> durations of the successful reads of that block
+        self.read_durations: dict[tuple[int, int], deque[float]] = {}
+        self.flush_durations: deque[float] = deque(maxlen=window)
+        self.write_log: deque[dict] = deque(maxlen=WRITE_LOG_SIZE)
+        self.reads = 0
+        self.read_failures = 0
+        self.retries = 0
+        self._cycle_requests = 0
+        self._cycle_retries = 0
+
+    def start_cycle(self) -> None:
+        """Start counting the requests and retries of a new poll cycle."""
+        self._cycle_requests = 0
+        self._cycle_retries = 0
+
+    def record_read(self, block: tuple[int, int], duration: float | None) -> None:
+        """Record a read of a block, duration is None when it failed."""
+        self.reads += 1
+        self._cycle_requests += 1
+        if duration is None:
+            self.read_failures += 1
+            return
+        durations = self.read_durations.get(block)
+        if durations is None:
+            durations = self.read_durations[block] = deque(maxlen=self.window)
+        durations.append(duration)
+
+    def record_retry(self) -> None:
+        """Record that a failed read is retried."""
+        self.retries += 1
+        self._cycle_retries += 1
+
+    def end_cycle(self, duration: float) -> None:
+        """Record the duration and retries of the cycle, unless it sent no request."""
+        if self._cycle_requests:
+            self.cycle_durations.append(duration)
+            self.cycle_retries.append(self._cycle_retries)
+
+    def record_flush(self, duration: float) -> None:
+        """Record the time a write flush took from the first write to the confirmed read-back."""
+        self.flush_durations.append(duration)
+
+    def record_write(self, address: int, values: list[int], result: str, duration: float) -> None:
+        """Log a run of registers written in a flush with its outcome."""
+        self.write_log.append({
+            "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "address": address,
+            "values": list(values),
+            "result": result,
+            "flush_ms": milliseconds(duration),
+        })
+
+    def summary(self, samples: Iterable[float]) -> dict:
+        """Return the p50 and p95 in milliseconds and the number of samples."""
+        samples = list(samples)
+        return {
+            "p50": milliseconds(percentile(samples, 0.5)),
+            "p95": milliseconds(percentile(samples, 0.95)),
+            "samples": len(samples),
+        }
+
+    def read_summary(self) -> dict[str, float | None]:
+        """Return the median round-trip time in milliseconds per read block."""
+        return {
+            block_name(block): milliseconds(percentile(durations, 0.5))
+            for block, durations in sorted(self.read_durations.items())
+        }
+
+    def all_read_durations(self) -> list[float]:
+        """Return the read durations of every block together."""
+        return [duration for durations in self.read_durations.values() for duration in durations]
+
+    def as_dict(self) -> dict:
+        """Return the histograms, summaries and counters of every window."""
+        return {
+            "window": self.window,
+            "cycles": {
+                **self.summary(self.cycle_durations),
+                "histogram": histogram(self.cycle_durations),
+                "retries": list(self.cycle_retries),
+            },
+            "reads": {
+                **self.summary(self.all_read_durations()),
+                "histogram": histogram(self.all_read_durations()),
+                "blocks": {
+                    block_name(block): {**self.summary(durations), "histogram": histogram(durations)}
+                    for block, durations in sorted(self.read_durations.items())
+                },
+            },
+            "flushes": {
+                **self.summary(self.flush_durations),
+                "histogram": histogram(self.flush_durations),
+            },
+            "counters": {
+                "reads": self.reads,
+                "read_failures": self.read_failures,
+                "retries": self.retries,
+            },
+        }
@@ -0,0 +1,93 @@
+"""Health of the Modbus read blocks of the Itho Amber integration."""
+
+import logging
+import time
+from collections.abc import Iterable
+
+from .const import READABLE_REGISTER_WINDOWS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Failed cycles in a row, while other blocks could be read, before a block is bisected
+BISECT_THRESHOLD = 3
+# Seconds between re-probes of a quarantined register
+QUARANTINE_REPROBE_INTERVAL = 900
+
+
+def split_windows(windows: Iterable[tuple[int, int]], excluded: Iterable[int]) -> tuple[tuple[int, int], ...]:
+    """Return the readable windows with the excluded addresses cut out."""
+    excluded = sorted(set(excluded))
+    result = []
+    for start, count in windows:
+        end = start + count
+        for address in excluded:
+            if start <= address < end:
+                if address > start:
+                    result.append((start, address - start))
+                start = address + 1
+        if start < end:
+            result.append((start, end - start))
+    return tuple(result)
+
+
+class RangeHealth:
+    """Failure statistics per read block and quarantined register addresses.
+
+    A block that keeps failing while the gateway answers other blocks is
+    reported for bisection. The registers bisection isolates are quarantined:
+    they are left out of the read plan, so blocks no longer cover them, and
+    are re-probed every reprobe_interval seconds.
+    """
+
+    def __init__(self, bisect_threshold: int = BISECT_THRESHOLD, reprobe_interval: float = QUARANTINE_REPROBE_INTERVAL) -> None:
+        """Initialize an empty health map."""
+        self.bisect_threshold = bisect_threshold
+        self.reprobe_interval = reprobe_interval
+        # (start, count) -> {"successes", "failures", "consecutive_failures"}
+        self.blocks: dict[tuple[int, int], dict[str, int]] = {}
+        # Quarantined address -> monotonic time of the next re-probe
+        self.quarantined: dict[int, float] = {}
+
+    def record(self, block: tuple[int, int], success: bool) -> None:
+        """Record the outcome of reading a block in a cycle."""
+        stats = self.blocks.setdefault(block, {"successes": 0, "failures": 0, "consecutive_failures": 0})
+        if success:
+            stats["successes"] += 1
+            stats["consecutive_failures"] = 0
+        else:
+            stats["failures"] += 1
+            stats["consecutive_failures"] += 1
+
+    def needs_bisect(self, block: tuple[int, int]) -> bool:
+        """Return True if a block failed often enough in a row to be bisected."""
+        stats = self.blocks.get(block)
+        return stats is not None and stats["consecutive_failures"] >= self.bisect_threshold
+
+    def reset(self, block: tuple[int, int]) -> None:
+        """Forget the failure streak of a block, e.g. after bisection."""
+        if block in self.blocks:
+            self.blocks[block]["consecutive_failures"] = 0
+
+    def quarantine(self, addresses: Iterable[int]) -> None:
+        """Leave addresses out of the read plan until a re-probe succeeds."""
+        retry_at = time.monotonic() + self.reprobe_interval
+        for address in addresses:
+            _LOGGER.warning(f"Register {address} cannot be read, quarantined for {self.reprobe_interval}s")
+            self.quarantined[address] = retry_at
+
+    def due_probes(self) -> list[int]:
+        """Return the quarantined addresses that are due for a re-probe."""
+        now = time.monotonic()
+        return [address for address, retry_at in self.quarantined.items() if now >= retry_at]
+
+    def probe_result(self, address: int, success: bool) -> None:
+        """Release a quarantined address after a good probe, or postpone the next one."""
+        if success:
+            _LOGGER.info(f"Register {address} can be read again, released from quarantine")
+            self.quarantined.pop(address, None)
+        else:
+            self.quarantined[address] = time.monotonic() + self.reprobe_interval
+
+    def windows(self, base=READABLE_REGISTER_WINDOWS) -> tuple[tuple[int, int], ...]:
+        """Return the readable windows without the quarantined addresses."""
+        return split_windows(base, self.quarantined)
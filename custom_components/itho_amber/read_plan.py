@@ -0,0 +1,94 @@
+"""Modbus read planner for the Itho Amber integration."""
+
+from collections.abc import Iterable
+
+from . import const
+from .const import READABLE_REGISTER_WINDOWS, REGISTER_DEPENDENCIES
+
+# Maximum number of registers in a single read holding registers (FC3) request
+MAX_REGISTERS_PER_READ = 125
+
+# Cost of one extra request expressed in registers of payload. A request on a
+# RS485 gateway costs the gateway turnaround plus request/response framing,
+# which is roughly the time it takes to transfer 20 extra registers.
+ROUND_TRIP_COST = 20
+
+# Entity description tables in const, built on first use
+ENTITY_TABLES = (
+    "SENSOR_TYPES",
+    "NUMBER_TYPES",
+    "SWITCH_TYPES",
+    "SELECT_CONTROL",
+    "SELECT_WORKING",
+    "SELECT_HWTBH",
+    "SELECT_PUMP_P0_WORKING_MODE",
+    "SELECT_PUMP_P0_SPEED",
+)
+
+
+def entity_keys() -> list[str]:
+    """Return the keys of all entity descriptions."""
+    return [key for table in ENTITY_TABLES for key in getattr(const, table)]
+
+
+def key_registers(key: str) -> tuple[int, ...]:
+    """Return the register addresses an entity key is decoded from."""
+    if key in REGISTER_DEPENDENCIES:
+        return REGISTER_DEPENDENCIES[key]
+    if key.isdigit():
+        return (int(key),)
+    return ()
+
+
+def entity_registers(keys: Iterable[str]) -> set[int]:
+    """Return the register addresses needed to decode the given keys."""
+    return {register for key in keys for register in key_registers(key)}
+
+
+def _window_index(address: int, windows) -> int | tuple[int]:
+    """Return the window an address belongs to, or a unique marker if none."""
+    for index, (start, count) in enumerate(windows):
+        if start <= address < start + count:
+            return index
+    return (address,)
+
+
+def build_read_plan(
+    registers: Iterable[int],
+    round_trip_cost: int = ROUND_TRIP_COST,
+    max_count: int = MAX_REGISTERS_PER_READ,
+    windows=READABLE_REGISTER_WINDOWS,
+) -> list[tuple[int, int]]:
+    """Group register addresses into (start, count) read blocks.
+
+    Every block costs one round trip plus the registers it spans, including
+    the unused registers in gaps it bridges. The cheapest split of the sorted
+    addresses into blocks of at most max_count registers, each inside a
+    single readable window, is returned.
+    """
+    addresses = sorted(set(registers))
+    if not addresses:
+        return []
+    window = [_window_index(address, windows) for address in addresses]
+
+    # best[i] = (cost, start index of last block) for addresses[:i]
+    best: list[tuple[int, int]] = [(0, 0)]
+    for end in range(len(addresses)):
+        candidate = None
+        for start in range(end, -1, -1):
+            span = addresses[end] - addresses[start] + 1
+            if span > max_count or window[start] != window[end]:
+                break
+            cost = best[start][0] + round_trip_cost + span
+            if candidate is None or cost < candidate[0]:
+                candidate = (cost, start)
+        best.append(candidate)
+
+    plan = []
+    end = len(addresses)
+    while end > 0:
+        start = best[end][1]
+        plan.append((addresses[start], addresses[end - 1] - addresses[start] + 1))
+        end = start
+    plan.reverse()
+    return plan
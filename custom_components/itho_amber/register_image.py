@@ -0,0 +1,98 @@
+"""In-place register image for the Itho Amber integration."""
+
+import time
+from array import array
+from collections.abc import Iterable
+
+from .const import READABLE_REGISTER_WINDOWS
+
+REGISTER_IMAGE_SIZE = max(start + count for start, count in READABLE_REGISTER_WINDOWS)
+DIFF_CHUNK = 32  # Registers compared at once when diffing against a snapshot
+
+
+class RegisterImage:
+    """Last value read for every holding register, indexed by address.
+
+    Values live in a single array('h') so they are signed INT16 without any
+    conversion. Read responses are copied in place through an unsigned view
+    of the same buffer, and a validity byte per address tells registers that
+    were never read, or not read for too long, apart from registers that
+    hold 0.
+    """
+
+    __slots__ = ("values", "valid", "read_at", "_words")
+
+    def __init__(self, size: int = REGISTER_IMAGE_SIZE) -> None:
+        """Create an empty image for addresses 0 up to size."""
+        self.values = array("h", bytes(2 * size))
+        self.valid = bytearray(size)
+        # Monotonic time of the last successful read per address
+        self.read_at = array("d", bytes(8 * size))
+        # Unsigned view of the same buffer, Modbus responses hold raw words
+        self._words = memoryview(self.values).cast("B").cast("H")
+
+    def __len__(self) -> int:
+        """Return the number of addresses in the image."""
+        return len(self.valid)
+
+    def get(self, address: int, default=None):
+        """Return the signed value at an address, or default if never read."""
+        if 0 <= address < len(self.valid) and self.valid[address]:
+            return self.values[address]
+        return default
+
+    def update(self, start: int, registers: Iterable[int], read_at: float | None = None) -> None:
+        """Store a block of raw register words read from start onwards.
+
+        read_at is the monotonic time the words were read, now by default.
+        """
+        words = array("H", registers)
+        end = start + len(words)
+        self._words[start:end] = words
+        self.valid[start:end] = b"\x01" * len(words)
+        self.read_at[start:end] = array("d", (time.monotonic() if read_at is None else read_at,)) * len(words)
+
+    def invalidate(self, start: int, count: int) -> None:
+        """Forget the values of a block, e.g. registers that were written."""
+        self.valid[start:start + count] = bytes(count)
+
+    def expire(self, addresses: Iterable[int], before: float) -> None:
+        """Forget the values of addresses that were last read before a monotonic time."""
+        valid = self.valid
+        read_at = self.read_at
+        for address in addresses:
+            if valid[address] and read_at[address] < before:
+                valid[address] = 0
+
+    def snapshot(self) -> tuple[bytes, bytes]:
+        """Return an immutable copy of the image to diff against later."""
+        return self.values.tobytes(), bytes(self.valid)
+
+    def changed_since(self, snapshot: tuple[bytes, bytes]) -> list[int]:
+        """Return the addresses whose value or validity changed since the snapshot."""
+        old_words, old_valid = snapshot
+        words = self.values.tobytes()
+        valid = self.valid
+        if old_valid == valid and old_words == words:
+            return []
+
+        # Compare fixed-size chunks as bytes and only walk the chunks that differ
+        old = array("h")
+        old.frombytes(old_words)
+        values = self.values
+        changed = []
+        for start in range(0, len(valid), DIFF_CHUNK):
+            end = start + DIFF_CHUNK
+            if old_valid[start:end] == valid[start:end] and old_words[2 * start:2 * end] == words[2 * start:2 * end]:
+                continue
+            changed.extend(
+                address
+                for address in range(start, min(end, len(valid)))
+                if valid[address] != old_valid[address] or (valid[address] and values[address] != old[address])
+            )
+        return changed
+
+    def as_dict(self) -> dict[int, int]:
+        """Return the valid registers as an address -> value dict."""
+        values = self.values
+        return {address: values[address] for address, is_valid in enumerate(self.valid) if is_valid}
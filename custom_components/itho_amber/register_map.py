@@ -0,0 +1,48 @@
+"""Register map of the Itho Amber integration.
+
+register_map.json lists every register the integration knows: its address,
+codec type, scale, lookup table and bit, and the metadata of the entity
+that shows it. The entity descriptions in const and the hub's decode and
+encode plan are both compiled from it, so they cannot drift apart.
+"""
+
+import json
+from pathlib import Path
+
+REGISTER_MAP_FILE = Path(__file__).with_name("register_map.json")
+
+
+def _load_register_map() -> dict:
+    """Read the register map shipped with the integration."""
+    with REGISTER_MAP_FILE.open(encoding="utf-8") as file:
+        return json.load(file)
+
+
+REGISTER_MAP = _load_register_map()
+
+# Lookup tables by name: raw value (or bit number) -> label
+ENUMS: dict[str, dict[int, str]] = {
+    name: {int(value): label for value, label in table.items()}
+    for name, table in REGISTER_MAP["enums"].items()
+}
+
+
+def register_codecs() -> dict[str, tuple]:
+    """Return the decode metadata per key: (codec, register, aux register, scale, table, bit)."""
+    return {
+        entry["key"]: (
+            entry["type"],
+            entry["address"],
+            entry.get("aux"),
+            entry.get("scale"),
+            ENUMS[entry["enum"]] if "enum" in entry else None,
+            entry.get("bit"),
+        )
+        for entry in REGISTER_MAP["registers"]
+        if "type" in entry
+    }
+
+
+def entity_entries(table: str) -> list[dict]:
+    """Return the register map entries of an entity description table, in order."""
+    return [entry for entry in REGISTER_MAP["registers"] if entry.get("entity") == table]
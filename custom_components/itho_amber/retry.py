@@ -0,0 +1,100 @@
+"""Retry policy and circuit breaker for Modbus reads of the Itho Amber integration."""
+
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class RetryPolicy:
+    """Decide how often and how long a poll cycle keeps retrying reads.
+
+    Failed reads are retried with exponential backoff as long as the cycle's
+    time budget allows. After failure_threshold cycles in a row in which
+    nothing could be read, the circuit opens and cycles skip the gateway
+    until open_interval has passed. The next cycle then probes the gateway
+    with a single cheap read before polling resumes; every failed probe
+    doubles the open interval up to max_open_interval.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 0.25,
+        max_delay: float = 2.0,
+        cycle_budget: float = 15.0,
+        failure_threshold: int = 3,
+        open_interval: float = 30.0,
+        max_open_interval: float = 300.0,
+    ) -> None:
+        """Initialize the policy with the circuit closed."""
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.cycle_budget = cycle_budget
+        self.failure_threshold = failure_threshold
+        self.open_interval = open_interval
+        self.max_open_interval = max_open_interval
+
+        self._deadline = 0.0
+        self._failed_cycles = 0
+        self._opened = False
+        self._current_open_interval = open_interval
+        self._retry_at = 0.0
+
+    def start_cycle(self) -> None:
+        """Start the time budget of a new poll cycle."""
+        self._deadline = time.monotonic() + self.cycle_budget
+
+    def remaining(self) -> float:
+        """Return the seconds left in the budget of the current cycle."""
+        return max(0.0, self._deadline - time.monotonic())
+
+    def backoff(self, attempt: int) -> float | None:
+        """Return the delay before retrying after a failed attempt, None to give up.
+
+        attempt counts from 1 for the first failed attempt.
+        """
+        if attempt >= self.attempts:
+            return None
+        delay = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+        # Leave time for the retry itself, not only for waiting
+        if delay >= self.remaining():
+            return None
+        return delay
+
+    @property
+    def state(self) -> str:
+        """Return the state of the circuit breaker."""
+        if not self._opened:
+            return CIRCUIT_CLOSED
+        if time.monotonic() < self._retry_at:
+            return CIRCUIT_OPEN
+        return CIRCUIT_HALF_OPEN
+
+    def record_success(self) -> None:
+        """Close the circuit after a cycle or probe that read data."""
+        if self._opened:
+            _LOGGER.info("Modbus gateway responds again, resuming polling")
+        self._failed_cycles = 0
+        self._opened = False
+        self._current_open_interval = self.open_interval
+
+    def record_failure(self) -> None:
+        """Count a cycle or probe that read nothing, opening the circuit when needed."""
+        self._failed_cycles += 1
+        if self._opened:
+            # Probe failed, back off further
+            self._current_open_interval = min(self._current_open_interval * 2, self.max_open_interval)
+        elif self._failed_cycles < self.failure_threshold:
+            return
+        else:
+            self._opened = True
+            _LOGGER.warning(
+                f"No Modbus data for {self._failed_cycles} cycles, pausing polling for {self._current_open_interval:.0f}s"
+            )
+        self._retry_at = time.monotonic() + self._current_open_interval
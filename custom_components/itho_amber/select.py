@@ -8,8 +8,6 @@ from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 import homeassistant.util.dt as dt_util
 
-from pymodbus.client import ModbusTcpClient
-
 from .const import (
     ATTR_MANUFACTURER,
     DOMAIN,
@@ -119,7 +117,7 @@ class AmberSelectControlMode(CoordinatorEntity, SelectEntity):
         self._options = EXTERNAL_CONTROL
         self._attr_options = list(self._options.values())
 
-        super().__init__(coordinator=hub)
+        super().__init__(coordinator=hub, context=description.key)
 
     @property
     def name(self):
@@ -152,17 +150,9 @@ class AmberSelectControlMode(CoordinatorEntity, SelectEntity):
     #         selected = EXTERNAL_CONTROL[value]
     #     return selected
     
-    def select_option(self, option) -> None:
-        address = int(self.entity_description.key)
+    async def async_select_option(self, option) -> None:
         new_mode = get_key(self._options, option)
-        self._hub.write_registers(
-            address,
-            ModbusTcpClient.convert_to_registers(
-                int(new_mode),
-                data_type=ModbusTcpClient.DATATYPE.INT16,
-                word_order="big",
-            ),
-        )
+        await self._hub.write_value(self.entity_description.key, new_mode)
 
 class AmberSelectWorkingMode(CoordinatorEntity, SelectEntity):
     """Representation of a Amber Modbus select."""
@@ -182,7 +172,7 @@ class AmberSelectWorkingMode(CoordinatorEntity, SelectEntity):
         self._options = CURRENT_WORKING_MODE
         self._attr_options = list(self._options.values())
 
-        super().__init__(coordinator=hub)
+        super().__init__(coordinator=hub, context=description.key)
 
     @property
     def name(self):
@@ -215,17 +205,9 @@ class AmberSelectWorkingMode(CoordinatorEntity, SelectEntity):
     #         selected = CURRENT_WORKING_MODE[value]
     #     return selected
     
-    def select_option(self, option) -> None:
-        address = int(self.entity_description.key)
+    async def async_select_option(self, option) -> None:
         new_mode = get_key(self._options, option)
-        self._hub.write_registers(
-            address,
-            ModbusTcpClient.convert_to_registers(
-                int(new_mode),
-                data_type=ModbusTcpClient.DATATYPE.INT16,
-                word_order="big",
-            ),
-        )
+        await self._hub.write_value(self.entity_description.key, new_mode)
 
 class AmberSelectHWTBHMode(CoordinatorEntity, SelectEntity):
     """Representation of a Amber Modbus select."""
@@ -245,7 +227,7 @@ class AmberSelectHWTBHMode(CoordinatorEntity, SelectEntity):
         self._options = HWTBH_PRIORITY_MODE
         self._attr_options = list(self._options.values())
 
-        super().__init__(coordinator=hub)
+        super().__init__(coordinator=hub, context=description.key)
 
     @property
     def name(self):
@@ -278,17 +260,9 @@ class AmberSelectHWTBHMode(CoordinatorEntity, SelectEntity):
     #         selected = HWTBH_PRIORITY_MODE[value]
     #     return selected
     
-    def select_option(self, option) -> None:
-        address = int(self.entity_description.key)
+    async def async_select_option(self, option) -> None:
         new_mode = get_key(self._options, option)
-        self._hub.write_registers(
-            address,
-            ModbusTcpClient.convert_to_registers(
-                int(new_mode),
-                data_type=ModbusTcpClient.DATATYPE.INT16,
-                word_order="big",
-            ),
-        )
+        await self._hub.write_value(self.entity_description.key, new_mode)
 
 class AmberSelectP0PumpMode(CoordinatorEntity, SelectEntity):
     """Representation of a Amber Modbus select."""
@@ -308,7 +282,7 @@ class AmberSelectP0PumpMode(CoordinatorEntity, SelectEntity):
         self._options = PUMP_P0_WORKING_MODE
         self._attr_options = list(self._options.values())
 
-        super().__init__(coordinator=hub)
+        super().__init__(coordinator=hub, context=description.key)
 
     @property
     def name(self):
@@ -342,17 +316,9 @@ class AmberSelectP0PumpMode(CoordinatorEntity, SelectEntity):
     #         selected = PUMP_P0_WORKING_MODE[value]
     #     return selected
     
-    def select_option(self, option) -> None:
-        address = int(self.entity_description.key)
+    async def async_select_option(self, option) -> None:
         new_mode = get_key(self._options, option)
-        self._hub.write_registers(
-            address,
-            ModbusTcpClient.convert_to_registers(
-                int(new_mode),
-                data_type=ModbusTcpClient.DATATYPE.INT16,
-                word_order="big",
-            ),
-        )
+        await self._hub.write_value(self.entity_description.key, new_mode)
 
 class AmberSelectP0PumpSpeed(CoordinatorEntity, SelectEntity):
     def __init__(self, platform_name, hub, device_info, description):
@@ -362,7 +328,7 @@ class AmberSelectP0PumpSpeed(CoordinatorEntity, SelectEntity):
         self._hub = hub
         self._options = PUMP_SPEED
         self._attr_options = list(self._options.values())
-        super().__init__(coordinator=hub)
+        super().__init__(coordinator=hub, context=description.key)
 
     @property
     def name(self):
@@ -393,15 +359,6 @@ class AmberSelectP0PumpSpeed(CoordinatorEntity, SelectEntity):
     #     value = self.coordinator.data.get(self.entity_description.key)
     #     return PUMP_SPEED.get(value)
    
-    def select_option(self, option) -> None:
-        address = int(self.entity_description.key)
+    async def async_select_option(self, option) -> None:
         new_mode = get_key(self._options, option)
-        
-        self._hub.write_registers(
-            address,
-            ModbusTcpClient.convert_to_registers(
-                int(new_mode),
-                data_type=ModbusTcpClient.DATATYPE.INT16,
-                word_order="big",
-            ),
-        )
+        await self._hub.write_value(self.entity_description.key, new_mode)
@@ -60,7 +60,7 @@ class AmberSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_info = device_info
         self.entity_description: AmberModbusSensorEntityDescription = description
 
-        super().__init__(coordinator=hub)
+        super().__init__(coordinator=hub, context=description.key)
 
     @property
     def name(self):
@@ -71,6 +71,11 @@ class AmberSensor(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> Optional[str]:
         return f"{self._platform_name}_{self.entity_description.key}"
 
+    @property
+    def extra_state_attributes(self):
+        """Return the rolling statistics of a diagnostic sensor, e.g. the p50 and p95."""
+        return self.coordinator.diagnostic_attributes(self.entity_description.key)
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
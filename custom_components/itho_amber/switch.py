@@ -1,14 +1,12 @@
 """Platform for switch integration."""
 
 from __future__ import annotations
-import asyncio
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.switch import SwitchEntity
 
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 import homeassistant.util.dt as dt_util
-from pymodbus.client import ModbusTcpClient
 
 from .const import (
     ATTR_MANUFACTURER,
@@ -19,6 +17,7 @@ from .const import (
     ATTR_COPYRIGHT,
     ATTR_SW_VERSION,
 )
+from .hub import AmberWriteError
 
 async def async_setup_entry(hass, entry, async_add_entities):
     hub_name = entry.data[CONF_NAME]
@@ -50,9 +49,6 @@ async def async_setup_entry(hass, entry, async_add_entities):
 class AmberSwitch(CoordinatorEntity, SwitchEntity):
     """Representation of a Amber Modbus switch."""
 
-    POLL_FREQUENCY_SECONDS = 15
-    MAX_STATUS_CHANGE_TIME_SECONDS = 30 #Todo: make this dependend on main poll intervall
-
     def __init__(
         self,
         platform_name: str,
@@ -67,12 +63,12 @@ class AmberSwitch(CoordinatorEntity, SwitchEntity):
         self.entity_description: AmberModbusSwitchEntity = description
         self._hub = hub
 
-        super().__init__(coordinator=hub)
-        self._attr_is_on = self.coordinator.data[self.entity_description.key]
+        super().__init__(coordinator=hub, context=description.key)
+        self._attr_is_on = self.coordinator.data.get(self.entity_description.key)
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._attr_is_on = self.coordinator.data[self.entity_description.key]
+        self._attr_is_on = self.coordinator.data.get(self.entity_description.key)
         self.async_write_ha_state()
 
     @property
@@ -86,32 +82,23 @@ class AmberSwitch(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Send the on command."""
-        address = int(self.entity_description.key)
-        self._hub.write_registers(address, ModbusTcpClient.convert_to_registers(int(1), data_type=ModbusTcpClient.DATATYPE.INT16, word_order="big"))
-
-        for _ in range(
-                self.MAX_STATUS_CHANGE_TIME_SECONDS // self.POLL_FREQUENCY_SECONDS
-            ):
-                await asyncio.sleep(self.POLL_FREQUENCY_SECONDS)
-                
-                if not self.coordinator.data[self.entity_description.key]:
-                    self._attr_is_on = True
-                    break
-        
-        await self.coordinator.async_request_refresh()
+        await self._async_set_state(True)
 
     async def async_turn_off(self, **kwargs):
         """Send the off command."""
-        address = int(self.entity_description.key)
-        self._hub.write_registers(address, ModbusTcpClient.convert_to_registers(int(0), data_type=ModbusTcpClient.DATATYPE.INT16, word_order="big"))
-        
-        for _ in range(
-                self.MAX_STATUS_CHANGE_TIME_SECONDS // self.POLL_FREQUENCY_SECONDS
-            ):
-                await asyncio.sleep(self.POLL_FREQUENCY_SECONDS)
-                
-                if not self.coordinator.data[self.entity_description.key]:
-                    self._attr_is_on = False
-                    break
-        
-        await self.coordinator.async_request_refresh()
\ No newline at end of file
+        await self._async_set_state(False)
+
+    async def _async_set_state(self, is_on: bool) -> None:
+        """Report the new state right away and reconcile it with the device."""
+        confirmation = self._hub.write_value(self.entity_description.key, int(is_on))
+
+        self._attr_is_on = is_on
+        self.async_write_ha_state()
+
+        try:
+            # The hub publishes the confirmed value to this entity
+            await confirmation
+        except AmberWriteError:
+            self._attr_is_on = self.coordinator.data.get(self.entity_description.key)
+            self.async_write_ha_state()
+            raise
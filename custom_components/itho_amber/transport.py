@@ -0,0 +1,66 @@
+"""Modbus transports of the Itho Amber integration.
+
+A transport decides how frames reach the heat pump: Modbus TCP to a
+gateway, RTU frames through a transparent TCP-to-serial bridge, or RTU on
+a local serial port. The hub and the shared connection are the same for
+all of them.
+"""
+
+from pymodbus import FramerType
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+
+from .const import TRANSPORT_RTU_OVER_TCP, TRANSPORT_SERIAL, TRANSPORT_TCP
+
+# Character framing on the RS485 bus: 8N1
+SERIAL_BYTESIZE = 8
+SERIAL_PARITY = "N"
+SERIAL_STOPBITS = 1
+BITS_PER_CHARACTER = 1 + SERIAL_BYTESIZE + (SERIAL_PARITY != "N") + SERIAL_STOPBITS
+# Above 19200 baud the Modbus spec fixes the silent interval at 1.75 ms
+FIXED_FRAME_GAP_BAUDRATE = 19200
+FIXED_FRAME_GAP = 0.00175
+
+
+def inter_frame_delay(transport: str, baudrate: int) -> float:
+    """Return the bus silence (t3.5) needed between RTU frames, 0 for Modbus TCP.
+
+    The connection waits exactly this long after a response before sending
+    the next request, so block reads follow each other as fast as the bus
+    allows.
+    """
+    if transport == TRANSPORT_TCP:
+        return 0.0
+    if baudrate > FIXED_FRAME_GAP_BAUDRATE:
+        return FIXED_FRAME_GAP
+    return 3.5 * BITS_PER_CHARACTER / baudrate
+
+
+def create_client(transport: str, host: str, port: int, baudrate: int, timeout: float):
+    """Create a new asyncio Modbus client for a transport.
+
+    Retries and reconnects are handled by the hubs, so pymodbus is told not
+    to retry or reconnect on its own. For serial RTU host is the serial
+    device and port is not used.
+    """
+    if transport == TRANSPORT_SERIAL:
+        return AsyncModbusSerialClient(
+            port=host,
+            framer=FramerType.RTU,
+            baudrate=baudrate,
+            bytesize=SERIAL_BYTESIZE,
+            parity=SERIAL_PARITY,
+            stopbits=SERIAL_STOPBITS,
+            timeout=timeout,
+            retries=0,
+            reconnect_delay=0,
+        )
+    if transport not in (TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP):
+        raise ValueError(f"Unknown Modbus transport {transport}")
+    return AsyncModbusTcpClient(
+        host=host,
+        port=port,
+        framer=FramerType.RTU if transport == TRANSPORT_RTU_OVER_TCP else FramerType.SOCKET,
+        timeout=timeout,
+        retries=0,
+        reconnect_delay=0,
+    )
@@ -0,0 +1,490 @@
+"""Simulated Itho Amber heat pump behind a Modbus TCP gateway.
+
+Serves the register windows the Amber answers (the settings blocks, the
+499-546 realtime block and the 703-715 setpoints) from an image seeded
+with plausible values. Realtime values evolve while the simulator runs,
+and writes to settings are applied the way the controller does. Latency
+is configurable, so every change to the hub can be measured against the
+same target. Faults can be injected per register range or per
+transaction to exercise the hub's recovery paths. Run from the repository
+root in a Home Assistant development environment:
+
+    python tools/amber_simulator.py --port 5020 --latency 0.02
+    python tools/amber_simulator.py --fault timeout@505-510,probability=0.2 --fault busy,times=1,after=30,duration=20
+
+and add the integration with host 127.0.0.1 and port 5020. The simulator
+can also be started from other tools, see AmberSimulator.start().
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import struct
+import sys
+import time
+from array import array
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.itho_amber.const import FIRST_REALTIME_REGISTER, READABLE_REGISTER_WINDOWS  # noqa: E402
+from custom_components.itho_amber.register_image import REGISTER_IMAGE_SIZE  # noqa: E402
+from custom_components.itho_amber.register_map import REGISTER_MAP  # noqa: E402
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modbus function codes and exception codes served by the simulator
+READ_HOLDING_REGISTERS = 0x03
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_DATA_ADDRESS = 0x02
+ILLEGAL_DATA_VALUE = 0x03
+SERVER_DEVICE_FAILURE = 0x04
+SERVER_DEVICE_BUSY = 0x06
+GATEWAY_TARGET_FAILED = 0x0B
+MAX_READ_COUNT = 125
+MAX_WRITE_COUNT = 123
+
+MBAP_HEADER = struct.Struct(">HHHB")  # transaction ID, protocol ID, length, unit ID
+
+# Realtime registers not driven by the model: (address, raw value)
+STATIC_REALTIME = (
+    (500, 0),  # User level
+    (501, 120),  # Software version V1.2
+    (502, 0),
+    (503, 3 << 5),  # Database version, build 3
+    (504, 105),  # Outdoor unit software V1.05
+    (529, 231),  # Supply voltage
+    (530, 0),  # No defrost
+    (532, 1),  # Flow switch closed
+    (704, 350),  # Setpoint heating zone 2, 35.0 °C
+    (714, 180),  # Setpoint cooling zone 1, 18.0 °C
+    (715, 180),  # Setpoint cooling zone 2, 18.0 °C
+)
+ON_OFF_REGISTER = 0
+HEATING_REGISTER = 6
+SETPOINT_REGISTER = 703  # Actual setpoint heating zone 1
+STATUS_HEATING_STANDBY = 1  # Bits of the 499 status word
+STATUS_HEATING = 4
+
+
+class ModbusExceptionResponse(Exception):
+    """A request the simulated device answers with a Modbus exception."""
+
+    def __init__(self, code: int) -> None:
+        """Initialize with the Modbus exception code."""
+        super().__init__(f"Modbus exception {code}")
+        self.code = code
+
+
+# Fault kinds
+FAULT_DROP = "drop"  # Close the connection instead of answering
+FAULT_TIMEOUT = "timeout"  # Never answer the request
+FAULT_EXCEPTION = "exception"  # Answer with a Modbus exception, code
+FAULT_SHORT = "short"  # Answer a read with fewer registers than requested
+FAULT_SLOW = "slow"  # Answer after delay extra seconds
+FAULT_BUSY = "busy"  # Start a gateway-busy period of duration seconds
+FAULT_KINDS = (FAULT_DROP, FAULT_TIMEOUT, FAULT_EXCEPTION, FAULT_SHORT, FAULT_SLOW, FAULT_BUSY)
+
+
+@dataclass
+class Fault:
+    """A fault injected into matching transactions.
+
+    A transaction matches when it touches the register range [address,
+    address + count), or any transaction when address is None. After
+    skipping the first `after` matching transactions, each one is hit with
+    the given probability, at most `times` times (None for no limit).
+    """
+
+    kind: str
+    address: int | None = None
+    count: int = 1
+    probability: float = 1.0
+    after: int = 0
+    times: int | None = None
+    code: int = SERVER_DEVICE_FAILURE
+    delay: float = 1.0
+    duration: float = 10.0
+    seen: int = 0
+    hits: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate the fault kind."""
+        if self.kind not in FAULT_KINDS:
+            raise ValueError(f"Unknown fault {self.kind}, expected one of {', '.join(FAULT_KINDS)}")
+
+    @classmethod
+    def parse(cls, spec: str) -> "Fault":
+        """Parse kind[@start[-end]][,name=value...], e.g. timeout@505-510,probability=0.2."""
+        head, *options = spec.split(",")
+        kind, _, registers = head.partition("@")
+        fault = {"kind": kind}
+        if registers:
+            start, _, end = registers.partition("-")
+            fault["address"] = int(start)
+            fault["count"] = int(end or start) - int(start) + 1
+        types = {field.name: field.type for field in fields(cls)}
+        for option in options:
+            name, _, value = option.partition("=")
+            if name not in types or name in ("kind", "seen", "hits"):
+                raise ValueError(f"Unknown fault option {name}")
+            fault[name] = float(value) if name in ("probability", "delay", "duration") else int(value, 0)
+        return cls(**fault)
+
+    def matches(self, address: int, count: int) -> bool:
+        """Return True if a request for count registers from address falls in the fault's range."""
+        return self.address is None or (address < self.address + self.count and self.address < address + count)
+
+
+def _to_word(value: float, scale: float = 1) -> int:
+    """Return the INT16 register word of a value in its unit."""
+    return round(value / scale) & 0xFFFF
+
+
+def _readable_addresses() -> bytearray:
+    """Return a mask of the addresses the Amber answers."""
+    mask = bytearray(REGISTER_IMAGE_SIZE)
+    for start, count in READABLE_REGISTER_WINDOWS:
+        mask[start:start + count] = b"\x01" * count
+    return mask
+
+
+def _setting_limits() -> dict[int, tuple[int, int]]:
+    """Return the (min, max) the controller accepts per number setting."""
+    limits = {}
+    for entry in REGISTER_MAP["registers"]:
+        description = entry.get("description", {})
+        if entry.get("entity") == "NUMBER_TYPES" and "native_min_value" in description:
+            limits[entry["address"]] = (int(description["native_min_value"]), int(description["native_max_value"]))
+    return limits
+
+
+class AmberSimulator:
+    """Register image and device behaviour of a simulated Amber.
+
+    Requests from all connections go through one bus lock, like the RS485
+    bus behind a real gateway. Every transaction waits latency seconds plus
+    up to jitter seconds. Writes to settings are acknowledged right away and
+    show up in reads apply_delay seconds later; values outside the range of
+    a number setting are acknowledged but ignored, as the controller does.
+    Realtime values are updated every tick seconds, time_scale speeds up
+    the thermal model. The faults are checked in order for every
+    transaction, the first one that hits is injected.
+    """
+
+    def __init__(
+        self,
+        unit_ids=(1,),
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        apply_delay: float = 0.2,
+        tick: float = 1.0,
+        time_scale: float = 1.0,
+        seed: int | None = None,
+        faults=(),
+    ) -> None:
+        """Initialize the simulator with a freshly seeded register image."""
+        self.unit_ids = set(unit_ids)
+        self.latency = latency
+        self.jitter = jitter
+        self.apply_delay = apply_delay
+        self.tick = tick
+        self.time_scale = time_scale
+        self.random = random.Random(seed)
+        self.registers = array("H", bytes(2 * REGISTER_IMAGE_SIZE))
+        self.transactions = 0
+        self.faults: list[Fault] = list(faults)
+        self.injected: dict[str, int] = dict.fromkeys(FAULT_KINDS, 0)
+        self._busy_until = 0.0
+        self._readable = _readable_addresses()
+        self._limits = _setting_limits()
+        self._bus = asyncio.Lock()
+        self._server: asyncio.Server | None = None
+        self._clients: dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._evolve_task: asyncio.Task | None = None
+        self._pending_writes: set[asyncio.TimerHandle] = set()
+
+        # Thermal model state, in °C and Hz
+        self._clock = 0.0
+        self._ambient = 8.0
+        self._outlet = 30.0
+        self._dhw = 47.0
+        self._compressor = 0.0
+        self._averages = [self._ambient, self._ambient, self._ambient]
+        self._seed_registers()
+        self.evolve(0.0)
+
+    def _seed_registers(self) -> None:
+        """Fill the image with plausible settings and static realtime values."""
+        for entry in REGISTER_MAP["registers"]:
+            address = entry.get("address")
+            if address is None or address >= FIRST_REALTIME_REGISTER:
+                continue
+            if address in self._limits:
+                low, high = self._limits[address]
+                self.registers[address] = _to_word((low + high) // 2)
+        self.registers[ON_OFF_REGISTER] = 1
+        self.registers[HEATING_REGISTER] = 1
+        self.registers[SETPOINT_REGISTER] = _to_word(35.0, 0.1)
+        for address, value in STATIC_REALTIME:
+            self.registers[address] = value & 0xFFFF
+
+    def evolve(self, dt: float) -> None:
+        """Advance the thermal model by dt simulated seconds and update the realtime block."""
+        rnd = self.random
+        regs = self.registers
+        self._clock += dt
+
+        # Outdoor temperature follows a daily cycle with some noise
+        self._ambient = 8.0 + 5.0 * math.sin(2 * math.pi * self._clock / 86400) + rnd.uniform(-0.1, 0.1)
+        for i, period in enumerate((3600, 14400, 86400)):
+            weight = min(1.0, dt / period)
+            self._averages[i] += (self._ambient - self._averages[i]) * weight
+
+        setpoint = (regs[SETPOINT_REGISTER] if regs[SETPOINT_REGISTER] < 0x8000 else regs[SETPOINT_REGISTER] - 0x10000) / 10
+        running = regs[ON_OFF_REGISTER] == 1 and regs[HEATING_REGISTER] == 1
+        # The compressor ramps towards a speed set by the distance to the setpoint
+        target = min(90.0, max(20.0, (setpoint - self._outlet) * 12 + 30)) if running else 0.0
+        step = 2.0 * dt
+        self._compressor += max(-step, min(step, target - self._compressor))
+        heat_target = setpoint + 1 if running else self._ambient + 12
+        self._outlet += (heat_target - self._outlet) * min(1.0, 0.01 * dt) + rnd.uniform(-0.05, 0.05)
+        self._dhw += (45.0 - self._dhw) * min(1.0, 0.0005 * dt)
+
+        load = self._compressor / 90
+        inlet = self._outlet - 5.0 * load
+        values = {
+            505: self._outlet, 506: inlet, 507: self._outlet + 2.0 * load, 508: self._dhw,
+            509: self._outlet - 0.5, 510: self._outlet - 0.8, 511: self._outlet - 1.2,
+            517: self._ambient, 518: self._averages[0], 519: self._averages[1], 520: self._averages[2],
+            521: 12.0 + 0.3 * self._outlet * load, 522: 5.0 + 0.1 * self._ambient,
+            523: self._outlet + 30.0 * load, 524: self._ambient - 4.0 * load, 525: self._ambient - 3.0 * load,
+            528: 12.0 * load, 531: 20.5 + rnd.uniform(-0.05, 0.05), 537: 60.0 if running else 0.0,
+            538: 5.0 * load, 539: 0.0,
+        }
+        for address, value in values.items():
+            regs[address] = _to_word(value, 0.1)
+        regs[515] = round(self._compressor)
+        regs[516] = round(150 + 3 * self._compressor)
+        regs[526] = round(9 * self._compressor)
+        regs[514] = 1 if running else 0
+        regs[499] = 1 << (STATUS_HEATING if self._compressor > 0 else STATUS_HEATING_STANDBY)
+
+    def read(self, address: int, count: int) -> list[int]:
+        """Return count register words from address, like a read holding registers request."""
+        if not 1 <= count <= MAX_READ_COUNT:
+            raise ModbusExceptionResponse(ILLEGAL_DATA_VALUE)
+        if address < 0 or address + count > REGISTER_IMAGE_SIZE or not all(self._readable[address:address + count]):
+            raise ModbusExceptionResponse(ILLEGAL_DATA_ADDRESS)
+        return self.registers[address:address + count].tolist()
+
+    def write(self, address: int, values: list[int]) -> None:
+        """Accept a write of settings, applying it after apply_delay."""
+        if not 1 <= len(values) <= MAX_WRITE_COUNT:
+            raise ModbusExceptionResponse(ILLEGAL_DATA_VALUE)
+        end = address + len(values)
+        if address < 0 or end > FIRST_REALTIME_REGISTER or not all(self._readable[address:end]):
+            raise ModbusExceptionResponse(ILLEGAL_DATA_ADDRESS)
+
+        loop = asyncio.get_running_loop()
+        handle = None
+
+        def apply() -> None:
+            self._pending_writes.discard(handle)
+            for offset, word in enumerate(values):
+                limits = self._limits.get(address + offset)
+                signed = word - 0x10000 if word >= 0x8000 else word
+                if limits is not None and not limits[0] <= signed <= limits[1]:
+                    _LOGGER.debug(f"Ignoring out of range value {signed} for register {address + offset}")
+                    continue
+                self.registers[address + offset] = word
+
+        handle = loop.call_later(self.apply_delay, apply)
+        self._pending_writes.add(handle)
+
+    def process(self, pdu: bytes) -> bytes:
+        """Return the response PDU for a request PDU."""
+        function = pdu[0]
+        try:
+            if function == READ_HOLDING_REGISTERS:
+                address, count = struct.unpack_from(">HH", pdu, 1)
+                words = self.read(address, count)
+                return struct.pack(f">BB{len(words)}H", function, 2 * len(words), *words)
+            if function == WRITE_SINGLE_REGISTER:
+                address, value = struct.unpack_from(">HH", pdu, 1)
+                self.write(address, [value])
+                return pdu[:5]
+            if function == WRITE_MULTIPLE_REGISTERS:
+                address, count, byte_count = struct.unpack_from(">HHB", pdu, 1)
+                if byte_count != 2 * count or len(pdu) < 6 + byte_count:
+                    raise ModbusExceptionResponse(ILLEGAL_DATA_VALUE)
+                self.write(address, list(struct.unpack_from(f">{count}H", pdu, 6)))
+                return pdu[:5]
+            raise ModbusExceptionResponse(ILLEGAL_FUNCTION)
+        except struct.error:
+            return bytes((function | 0x80, ILLEGAL_DATA_VALUE))
+        except ModbusExceptionResponse as e:
+            return bytes((function | 0x80, e.code))
+
+    def _next_fault(self, pdu: bytes) -> Fault | None:
+        """Return the fault to inject into a request, if any."""
+        if not self.faults or len(pdu) < 5:
+            return None
+        address, count = struct.unpack_from(">HH", pdu, 1)
+        if pdu[0] == WRITE_SINGLE_REGISTER:
+            count = 1
+        for fault in self.faults:
+            if not fault.matches(address, count):
+                continue
+            fault.seen += 1
+            if fault.seen <= fault.after or (fault.times is not None and fault.hits >= fault.times):
+                continue
+            if fault.probability >= 1 or self.random.random() < fault.probability:
+                fault.hits += 1
+                self.injected[fault.kind] += 1
+                return fault
+        return None
+
+    async def async_transaction(self, unit: int, pdu: bytes) -> bytes | None:
+        """Run one transaction on the simulated bus and return the response PDU.
+
+        Returns None when the request is not answered and raises
+        ConnectionAbortedError when the connection should be dropped.
+        """
+        async with self._bus:
+            self.transactions += 1
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+            if delay:
+                await asyncio.sleep(delay)
+
+            fault = self._next_fault(pdu)
+            if fault is not None:
+                _LOGGER.debug(f"Injecting {fault.kind} fault")
+                if fault.kind == FAULT_BUSY:
+                    self._busy_until = time.monotonic() + fault.duration
+                elif fault.kind == FAULT_DROP:
+                    raise ConnectionAbortedError("Injected connection drop")
+                elif fault.kind == FAULT_TIMEOUT:
+                    return None
+                elif fault.kind == FAULT_EXCEPTION:
+                    return bytes((pdu[0] | 0x80, fault.code))
+                elif fault.kind == FAULT_SLOW:
+                    await asyncio.sleep(fault.delay)
+
+            if time.monotonic() < self._busy_until:
+                return bytes((pdu[0] | 0x80, SERVER_DEVICE_BUSY))
+            if unit not in self.unit_ids:
+                # Nothing answers this unit ID on the bus
+                return bytes((pdu[0] | 0x80, GATEWAY_TARGET_FAILED))
+            response = self.process(pdu)
+            if fault is not None and fault.kind == FAULT_SHORT and response[0] == READ_HOLDING_REGISTERS and response[1] > 2:
+                # A well-formed answer that lacks the last register
+                response = bytes((response[0], response[1] - 2)) + response[2:-2]
+            return response
+
+    async def _async_handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve Modbus TCP requests of one client connection."""
+        self._clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                header = await reader.readexactly(MBAP_HEADER.size)
+                transaction_id, protocol_id, length, unit = MBAP_HEADER.unpack(header)
+                pdu = await reader.readexactly(length - 1)
+                response = await self.async_transaction(unit, pdu)
+                if response is None:
+                    continue
+                writer.write(MBAP_HEADER.pack(transaction_id, protocol_id, len(response) + 1, unit) + response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+
+    async def _async_evolve_loop(self) -> None:
+        """Update the realtime registers every tick."""
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(self.tick)
+            now = time.monotonic()
+            self.evolve((now - last) * self.time_scale)
+            last = now
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving on host:port and return the port, port 0 picks a free one."""
+        self._server = await asyncio.start_server(self._async_handle_client, host, port)
+        self._evolve_task = asyncio.create_task(self._async_evolve_loop())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop serving and drop pending writes."""
+        if self._evolve_task is not None:
+            self._evolve_task.cancel()
+            self._evolve_task = None
+        for handle in self._pending_writes:
+            handle.cancel()
+        self._pending_writes.clear()
+        if self._server is not None:
+            self._server.close()
+            tasks = list(self._clients.values())
+            for writer in list(self._clients):
+                writer.close()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the simulator until interrupted."""
+    simulator = AmberSimulator(
+        unit_ids=args.unit,
+        latency=args.latency,
+        jitter=args.jitter,
+        apply_delay=args.apply_delay,
+        time_scale=args.time_scale,
+        seed=args.seed,
+        faults=[Fault.parse(spec) for spec in args.fault or ()],
+    )
+    port = await simulator.start(args.host, args.port)
+    print(f"Simulated Amber on {args.host}:{port}, unit IDs {sorted(simulator.unit_ids)}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+        if simulator.faults:
+            print(f"Injected faults: {simulator.injected}")
+
+
+def main() -> None:
+    """Parse the command line and run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    parser.add_argument("--unit", type=int, action="append", help="unit ID to answer, repeatable (default 1)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per transaction")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra seconds per transaction")
+    parser.add_argument("--apply-delay", type=float, default=0.2, help="seconds before a write reads back")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="speed of the thermal model")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--fault",
+        action="append",
+        help="inject a fault, repeatable: kind[@start[-end]][,name=value...] with kind one of "
+        f"{', '.join(FAULT_KINDS)} and names probability, after, times, code, delay, duration",
+    )
+    args = parser.parse_args()
+    args.unit = args.unit or [1]
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
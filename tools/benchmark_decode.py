@@ -0,0 +1,48 @@
+"""Benchmark decoding of a full Amber register image.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python tools/benchmark_decode.py
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.itho_amber.const import READABLE_REGISTER_WINDOWS, REGISTER_CODECS  # noqa: E402
+from custom_components.itho_amber.decoder import DecodePlan  # noqa: E402
+from custom_components.itho_amber.read_plan import entity_keys  # noqa: E402
+from custom_components.itho_amber.register_image import RegisterImage  # noqa: E402
+
+ROUNDS = 20000
+
+
+def main() -> None:
+    """Time compiling the decode plan and decoding one poll cycle."""
+    random.seed(0)
+    image = RegisterImage()
+    for start, count in READABLE_REGISTER_WINDOWS:
+        image.update(start, [random.randint(0, 3) for _ in range(count)])
+    keys = [*entity_keys(), *REGISTER_CODECS]
+
+    compile_time = timeit.timeit(lambda: DecodePlan(keys), number=100) / 100
+    plan = DecodePlan(keys)
+    decode_time = timeit.timeit(lambda: plan.decode(image), number=ROUNDS) / ROUNDS
+
+    snapshot = image.snapshot()
+    image.update(506, [7])
+    diff_time = timeit.timeit(lambda: image.changed_since(snapshot), number=ROUNDS // 10) / (ROUNDS // 10)
+    same_time = timeit.timeit(lambda: image.changed_since(image.snapshot()), number=ROUNDS) / ROUNDS
+
+    print(f"registers in image: {len(image.as_dict())}")
+    print(f"decoded keys:       {len(plan.decode(image))}")
+    print(f"compile plan:       {compile_time * 1e6:.1f} us (once per hub)")
+    print(f"decode per cycle:   {decode_time * 1e6:.1f} us")
+    print(f"snapshot + diff:    {same_time * 1e6:.1f} us unchanged, {diff_time * 1e6:.1f} us with a change")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Benchmark the Amber hub end to end against the simulated heat pump.
+
+Drives AmberModbusHub over Modbus TCP against tools/amber_simulator.py and
+measures poll cycles, the read of every range, decoding of the settings
+and realtime registers, writes until the read-back confirms them, and the
+event loop time spent notifying entities. Results are printed and written
+to a JSON file; pass the file of an earlier run as --baseline to see what
+changed. Run from the repository root in a Home Assistant development
+environment:
+
+    python tools/benchmark_poll.py --latency 0.005 --output poll_results.json
+    python tools/benchmark_poll.py --baseline poll_results.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from amber_simulator import AmberSimulator, Fault  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import frame  # noqa: E402
+
+from custom_components.itho_amber.const import (  # noqa: E402
+    ATTR_SW_VERSION,
+    DEFAULT_SCAN_INTERVAL,
+    FIRST_REALTIME_REGISTER,
+    NUMBER_TYPES,
+    POLL_TIERS,
+    REGISTER_CODECS,
+    REGISTER_DEPENDENCIES,
+    TIER_FAST,
+)
+from custom_components.itho_amber.decoder import DecodePlan  # noqa: E402
+from custom_components.itho_amber.hub import AmberModbusHub, AmberWriteError  # noqa: E402
+from custom_components.itho_amber.read_plan import entity_keys  # noqa: E402
+
+CYCLES = 30
+WRITES = 10
+DECODE_ROUNDS = 2000
+
+
+def summarize(samples: list[float], unit: float = 1e3) -> dict:
+    """Return count, mean and percentiles of samples in seconds, scaled to ms by default."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0}
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, round(p * (len(ordered) - 1)))] * unit
+
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered) * unit,
+        "min": ordered[0] * unit,
+        "p50": percentile(0.5),
+        "p95": percentile(0.95),
+        "max": ordered[-1] * unit,
+    }
+
+
+def decode_plans() -> dict[str, DecodePlan]:
+    """Return decode plans for the settings keys and for the realtime keys."""
+    settings, realtime = [], []
+    for key in dict.fromkeys([*entity_keys(), *REGISTER_CODECS]):
+        registers = REGISTER_DEPENDENCIES.get(key) or ((int(key),) if key.isdigit() else ())
+        if registers:
+            (realtime if max(registers) >= FIRST_REALTIME_REGISTER else settings).append(key)
+    return {"settings": DecodePlan(settings), "realtime": DecodePlan(realtime)}
+
+
+async def async_run(args: argparse.Namespace) -> dict:
+    """Run every measurement and return the results."""
+    simulator = AmberSimulator(
+        latency=args.latency, jitter=args.jitter, seed=0, faults=[Fault.parse(spec) for spec in args.fault or ()]
+    )
+    port = await simulator.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        frame.async_setup(hass)
+        hub = AmberModbusHub(hass, "benchmark", "127.0.0.1", port, DEFAULT_SCAN_INTERVAL)
+
+        # Time every Modbus read by range
+        range_times = defaultdict(list)
+        read = hub._async_read_holding_registers
+
+        async def timed_read(unit, address, count, **kwargs):
+            start = perf_counter()
+            try:
+                return await read(unit, address, count, **kwargs)
+            finally:
+                range_times[f"{address}-{address + count - 1}"].append(perf_counter() - start)
+
+        hub._async_read_holding_registers = timed_read
+
+        # One listener per entity, looking up its value like CoordinatorEntity does
+        for key in entity_keys():
+            hub.async_add_listener(lambda key=key: hub.data.get(key), context=key)
+        notify_times = []
+        update_listeners = hub.async_update_listeners
+
+        def timed_update_listeners() -> None:
+            start = perf_counter()
+            update_listeners()
+            notify_times.append(perf_counter() - start)
+
+        hub.async_update_listeners = timed_update_listeners
+
+        cycles = {"full": [], "fast": []}
+        try:
+            for i in range(args.cycles):
+                for name in cycles:
+                    # Every tier due for a full cycle, only the fast tier otherwise
+                    hub._tier_next_poll = {tier: 0.0 if name == "full" or tier == TIER_FAST else float("inf") for tier in POLL_TIERS}
+                    start = perf_counter()
+                    await hub.async_refresh()
+                    cycles[name].append(perf_counter() - start)
+
+            decode = {
+                name: timeit.timeit(lambda plan=plan: plan.decode(hub._registers), number=DECODE_ROUNDS) / DECODE_ROUNDS
+                for name, plan in decode_plans().items()
+            }
+
+            # Alternate a number setting between its limits
+            description = next(iter(NUMBER_TYPES.values()))
+            write_times = []
+            write_failures = []
+            for i in range(args.writes):
+                value = description.native_min_value if i % 2 else description.native_max_value
+                start = perf_counter()
+                try:
+                    await hub.write_value(description.key, value)
+                except AmberWriteError as e:
+                    # Only confirmed writes are timed, injected faults may fail some
+                    write_failures.append(str(e))
+                    continue
+                write_times.append(perf_counter() - start)
+        finally:
+            await hub.async_shutdown()
+            await simulator.stop()
+            await hass.async_stop(force=True)
+
+    return {
+        "version": ATTR_SW_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "settings": {
+            "cycles": args.cycles,
+            "writes": args.writes,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "faults": args.fault or [],
+        },
+        "transactions": simulator.transactions,
+        "cycle_full_ms": summarize(cycles["full"]),
+        "cycle_fast_ms": summarize(cycles["fast"]),
+        "range_ms": {name: summarize(times) for name, times in sorted(range_times.items(), key=lambda item: int(item[0].split("-")[0]))},
+        "decode_settings_us": decode["settings"] * 1e6,
+        "decode_realtime_us": decode["realtime"] * 1e6,
+        "write_confirmed_ms": summarize(write_times),
+        "write_failures": write_failures,
+        "notify_listeners_ms": summarize(notify_times),
+        "listeners": len(hub._listeners),
+    }
+
+
+def report(results: dict, baseline: dict | None) -> None:
+    """Print the results, with the change against a baseline run when given."""
+
+    def line(name: str, value: float, old: float | None, unit: str) -> None:
+        change = f"{(value / old - 1) * 100:+7.1f}%" if old else ""
+        print(f"{name:32} {value:10.3f} {unit:3} {change}")
+
+    def p50(data: dict | None, *path: str) -> float | None:
+        for key in path:
+            data = (data or {}).get(key)
+        return data.get("p50") if isinstance(data, dict) else data
+
+    print(f"Amber {results['version']}, {results['transactions']} Modbus transactions, p50 values")
+    if results["write_failures"]:
+        print(f"{len(results['write_failures'])} of {results['settings']['writes']} writes failed")
+    for metric in ("cycle_full_ms", "cycle_fast_ms", "write_confirmed_ms", "notify_listeners_ms"):
+        if results[metric]["count"]:
+            line(metric[:-3], results[metric]["p50"], p50(baseline, metric), "ms")
+    for metric in ("decode_settings_us", "decode_realtime_us"):
+        line(metric[:-3], results[metric], p50(baseline, metric), "us")
+    for name, stats in results["range_ms"].items():
+        line(f"range {name}", stats["p50"], p50(baseline, "range_ms", name), "ms")
+
+
+def main() -> None:
+    """Run the benchmark, print the results and write them to a JSON file."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cycles", type=int, default=CYCLES, help="poll cycles of each kind")
+    parser.add_argument("--writes", type=int, default=WRITES, help="confirmed writes to time")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per transaction")
+    parser.add_argument("--jitter", type=float, default=0.0, help="simulated random extra seconds per transaction")
+    parser.add_argument("--fault", action="append", help="simulator fault spec, see tools/amber_simulator.py")
+    parser.add_argument("--output", type=Path, default=Path("poll_results.json"))
+    parser.add_argument("--baseline", type=Path, help="results of an earlier run to compare with")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    results = asyncio.run(async_run(args))
+    report(results, baseline)
+    args.output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark the import and setup path of the Amber integration.
+
+Every step runs in a fresh interpreter so module caches do not hide the
+cost. Run from the repository root in a Home Assistant development
+environment:
+
+    python tools/benchmark_startup.py
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RUNS = 5
+
+# Imported before timing, Home Assistant itself is loaded before any integration
+PRELUDE = "import homeassistant.helpers.entity, homeassistant.helpers.update_coordinator"
+
+STEPS = {
+    "import integration": "import custom_components.itho_amber",
+    "import config flow": "import custom_components.itho_amber.config_flow",
+    "import + build descriptions": (
+        "from custom_components.itho_amber.read_plan import entity_keys; entity_keys()"
+    ),
+    "import + decode and read plans": (
+        "from custom_components.itho_amber.const import REGISTER_CODECS\n"
+        "from custom_components.itho_amber.decoder import DecodePlan\n"
+        "from custom_components.itho_amber.read_plan import build_read_plan, entity_keys, entity_registers\n"
+        "keys = entity_keys(); DecodePlan([*keys, *REGISTER_CODECS]); build_read_plan(entity_registers(keys))"
+    ),
+}
+
+TIMER = """
+import time
+{prelude}
+start = time.perf_counter()
+exec({code!r})
+print(time.perf_counter() - start)
+"""
+
+
+def measure(code: str) -> float:
+    """Return the median time in seconds of running code in a fresh interpreter."""
+    script = TIMER.format(prelude=PRELUDE, code=code)
+    times = [
+        float(subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, capture_output=True, text=True).stdout)
+        for _ in range(RUNS)
+    ]
+    return statistics.median(times)
+
+
+def main() -> None:
+    """Print the median time of every startup step."""
+    for name, code in STEPS.items():
+        print(f"{name:32} {measure(code) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()